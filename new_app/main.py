@@ -6,18 +6,24 @@ This file sets up Starlette with file-based routing for both API and React SSR.
 """
 
 from starlette.applications import Starlette
-from starlette.staticfiles import StaticFiles
-from starlette.responses import HTMLResponse, JSONResponse
+from starlette.responses import HTMLResponse, Response
 from starlette.routing import Route, Mount
 from starlette.requests import Request
 from pathlib import Path
+from typing import Optional
+import asyncio
+import functools
+import json
 import logging
 import os
 
 # Import Tavo core components
 from tavo.core.ssr import SSRRenderer
 from tavo.core.middleware import TavoMiddleware
-from tavo.core.routing import FileBasedRouter
+from tavo.core.responses import ORJSONResponse
+from tavo.core.static import SendfileStaticFiles
+from tavo.core.routing import FileBasedRouter, install_fallback_handler
+from tavo.core.bundler.utils import dumps_json
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -25,6 +31,8 @@ logger = logging.getLogger("tavo.main")
 
 # Check if we should log routes (set by dev server)
 SHOULD_LOG_ROUTES = os.getenv("TAVO_LOG_ROUTES") == "1"
+# HMR websocket advertised to clients; read once like the flag above
+HMR_WEBSOCKET_URL = os.getenv("TAVO_HMR_WS", "ws://localhost:3001")
 
 # Initialize paths
 project_root = Path(__file__).parent
@@ -33,6 +41,13 @@ api_dir = project_root / "api"
 public_dir = project_root / "public"
 build_dir = project_root / ".tavo"
 
+# Fully constant; encoded once at import
+_HMR_INFO_JSON = dumps_json({
+    "hmr": "enabled",
+    "websocket": HMR_WEBSOCKET_URL,
+    "build_dir": str(build_dir),
+}).encode("utf-8")
+
 # Initialize SSR renderer
 ssr_renderer = SSRRenderer()
 
@@ -42,91 +57,100 @@ app_router = FileBasedRouter(app_dir, renderer=ssr_renderer)
 
 
 def log_routes(app: Starlette, header: str = "📜 Registered routes:"):
+    if not logger.isEnabledFor(logging.INFO):
+        return
     logger.info(header)
     for route in app.routes:
         if isinstance(route, Route):
-            logger.info(f" - {route.path} {route.methods}")
+            logger.info(" - %s %s", route.path, route.methods)
         elif isinstance(route, Mount):
-            logger.info(f" - Mount {route.path}")
+            logger.info(" - Mount %s", route.path)
             for sub in route.routes:
                 if isinstance(sub, Route):
-                    logger.info(f"    ↳ {sub.path} {sub.methods}")
+                    logger.info("    ↳ %s %s", sub.path, sub.methods)
                 else:
-                    logger.info(f"    ↳ {sub}")
+                    logger.info("    ↳ %s", sub)
         else:
-            logger.info(f" - Other {route}")
+            logger.info(" - Other %s", route)
 
 # --- Endpoints --- #
 
-async def health_check(request: Request):
-    return JSONResponse({
+# Encoded once per discovery (see refresh_route_snapshots) rather than per request
+_health_json: Optional[bytes] = None
+_routes_info_json: Optional[bytes] = None
+
+
+def refresh_route_snapshots() -> None:
+    """Rebuild the health and route info payloads; call after route discovery."""
+    global _health_json, _routes_info_json
+    
+    api_routes = [
+        {
+            "path": route.path,
+            "methods": list(route.methods) if route.methods else ["GET"],
+            "type": "api"
+        }
+        for route in api_router.routes
+    ]
+    page_routes = [
+        {
+            "path": route.path,
+            "methods": list(route.methods) if route.methods else ["GET"],
+            "type": "page"
+        }
+        for route in app_router.routes
+    ]
+    
+    _health_json = dumps_json({
         "status": "healthy",
         "app": "New App",
         "routes": {
-            "api": len(api_router.routes),
-            "pages": len(app_router.routes),
+            "api": len(api_routes),
+            "pages": len(page_routes),
         },
-    })
+    }).encode("utf-8")
+    _routes_info_json = dumps_json({
+        "api": api_routes,
+        "pages": page_routes,
+        "total": len(api_routes) + len(page_routes)
+    }).encode("utf-8")
+
+
+async def health_check(request: Request):
+    if _health_json is None:
+        refresh_route_snapshots()
+    return Response(_health_json, media_type="application/json")
 
 
 async def routes_info(request: Request):
     """Return detailed route information for dev server."""
     try:
-        api_routes = []
-        page_routes = []
-        
-        # Get API route info
-        for route in api_router.routes:
-            api_routes.append({
-                "path": route.path,
-                "methods": list(route.methods) if route.methods else ["GET"],
-                "type": "api"
-            })
-        
-        # Get page route info
-        for route in app_router.routes:
-            page_routes.append({
-                "path": route.path,
-                "methods": list(route.methods) if route.methods else ["GET"],
-                "type": "page"
-            })
-        
-        return JSONResponse({
-            "api": api_routes,
-            "pages": page_routes,
-            "total": len(api_routes) + len(page_routes)
-        })
+        if _routes_info_json is None:
+            refresh_route_snapshots()
+        return Response(_routes_info_json, media_type="application/json")
         
     except Exception as e:
-        logger.error(f"Error getting route info: {e}")
-        return JSONResponse({"error": str(e)}, status_code=500)
+        logger.error("Error getting route info: %s", e)
+        return ORJSONResponse({"error": str(e)}, status_code=500)
 
 
 async def hmr_endpoint(request: Request):
-    return JSONResponse({
-        "hmr": "enabled",
-        "websocket": "ws://localhost:3001",
-        "build_dir": str(build_dir),
-    })
+    return Response(_HMR_INFO_JSON, media_type="application/json")
 
 
 async def ssr_handler(request: Request):
     """SSR catch-all handler - only for non-API routes."""
     path = request.url.path
     
-    # Double-check we're not handling API routes
-    if path.startswith('/api/'):
-        logger.warning(f"SSR handler received API request: {path}")
-        return JSONResponse({"error": "API route handled by SSR"}, status_code=500)
-    
     try:
         route_match = app_router.match_route(path)
 
         ssr_context = {
             "url": str(request.url),
             "method": request.method,
-            "headers": dict(request.headers),
-            "query_params": dict(request.query_params),
+            # Passed as-is: the renderer encodes Mappings directly, no copies
+            "headers": request.headers,
+            "query_params": request.query_params,
             "route_params": route_match.params if route_match else {},
         }
 
@@ -134,21 +158,20 @@ async def ssr_handler(request: Request):
         return HTMLResponse(content=html_content)
 
     except Exception as e:
-        logger.error(f"SSR error for path '{path}': {e}")
-        fallback_html = await _get_fallback_html(path)
+        logger.error("SSR error for path '%s': %s", path, e)
+        fallback_html = _get_fallback_html(path)
         return HTMLResponse(content=fallback_html)
 
 
-async def _get_fallback_html(path: str = "/") -> str:
-    """Fallback HTML for hydration."""
-    return f"""
+# Built and encoded once at import; only the initial path varies between requests
+_FALLBACK_HTML_PREFIX, _FALLBACK_HTML_SUFFIX = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8">
   <title>New App</title>
   <script>
-    window.__TAVO_INITIAL_PATH__ = "{path}";
+    window.__TAVO_INITIAL_PATH__ = %%INITIAL_PATH%%;
   </script>
 </head>
 <body>
@@ -156,7 +179,20 @@ async def _get_fallback_html(path: str = "/") -> str:
   <script src="/static/bundle.js"></script>
 </body>
 </html>
-"""
+""".encode("utf-8").split(b"%%INITIAL_PATH%%")
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_fallback_html(path: str = "/") -> bytes:
+    """
+    Fallback HTML for hydration, as the encoded response body.
+
+    Memoized per path (the page is pure in it), so a repeat failure reuses
+    the bytes and the response has nothing left to build or encode.
+    """
+    # JSON-encode for the script context; "</" can't close the tag early
+    path_js = json.dumps(path).replace("</", "<\\/").encode("utf-8")
+    return b"".join((_FALLBACK_HTML_PREFIX, path_js, _FALLBACK_HTML_SUFFIX))
 
 
 # --- Application Setup --- #
@@ -165,8 +201,9 @@ async def _get_fallback_html(path: str = "/") -> str:
 initial_routes = [
     Route("/health", health_check),
     Route("/_hmr", hmr_endpoint),
-    Mount("/static", StaticFiles(directory=public_dir), name="static"),
-    Mount("/favicon.ico", StaticFiles(directory=public_dir), name="favicon")
+    # Set TAVO_XSENDFILE=nginx|apache behind a proxy to let it send the files
+    Mount("/static", SendfileStaticFiles(directory=public_dir), name="static"),
+    Mount("/favicon.ico", SendfileStaticFiles(directory=public_dir), name="favicon")
 ]
 
 # Create the application with initial routes
@@ -183,17 +220,19 @@ async def startup():
     """Setup routes during startup to ensure correct order."""
     logger.info("🚀 Starting up New App...")
     
-    # Discover API routes
-    await api_router.discover_routes()
+    # Discover API and page routes concurrently; page routes feed route
+    # params to SSR
+    await asyncio.gather(api_router.discover_routes(), app_router.discover_routes())
+    refresh_route_snapshots()
     api_routes = api_router.get_starlette_routes()
     
-    logger.info(f"📡 Mounting {len(api_routes.routes)} API routes")
+    logger.info("📡 Mounting %s API routes", len(api_routes.routes))
     
-    # Add API mount to the router - this is key!
-    app.router.routes.insert(0, Mount("/api", api_routes))
+    # API mount goes first - this is key! One assignment, explicit priority order
+    app.router.routes[:] = [Mount("/api", api_routes), *app.router.routes]
     
-    # Add catch-all SSR route LAST
-    app.router.routes.append(Route("/{path:path}", ssr_handler))
+    # SSR handles whatever no other route matched
+    install_fallback_handler(app.router, ssr_handler)
     
     logger.info("✅ Routes configured")
     log_routes(app, "📜 Final route configuration:")
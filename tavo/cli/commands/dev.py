@@ -5,6 +5,7 @@ Run dev server: create ASGI app with routing, start HMR websocket server, start
 """
 
 import asyncio
+import html
 import subprocess
 import logging
 from pathlib import Path
@@ -15,21 +16,71 @@ import threading
 
 from starlette.applications import Starlette
 from starlette.staticfiles import StaticFiles
-from starlette.responses import HTMLResponse, JSONResponse
+from starlette.responses import HTMLResponse
 from starlette.routing import Route, Mount
 from starlette.requests import Request
 import uvicorn
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 from ..utils.npm import ensure_node_modules
 from tavo.core.hmr.websocket import HMRWebSocketServer
 from tavo.core.hmr.watcher import FileWatcher
 from tavo.core.utils.bundler import get_bundler_path, BundlerNotFound
 from tavo.core.ssr import SSRRenderer
 from tavo.core.middleware import TavoMiddleware
-from tavo.core.routing import FileBasedRouter
+from tavo.core.responses import ORJSONResponse
+from tavo.core.routing import FileBasedRouter, install_fallback_handler
 
 logger = logging.getLogger(__name__)
 
+# Fallback page served when SSR is unavailable; filled with str.replace per request
+_FALLBACK_HMR_SCRIPT = """
+<script>
+  // HMR WebSocket connection
+  const ws = new WebSocket('ws://localhost:__TAVO_HMR_PORT__');
+  ws.onmessage = (event) => {
+    const data = JSON.parse(event.data);
+    if (data.type === 'reload') {
+      window.location.reload();
+    }
+  };
+</script>"""
+
+_FALLBACK_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Tavo App - __TAVO_ROUTE__</title>
+    <style>
+        body { 
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+            margin: 0; padding: 2rem; background: #f5f5f5;
+        }
+        .container { 
+            max-width: 600px; margin: 0 auto; background: white; 
+            padding: 2rem; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        }
+        .error { color: #dc2626; background: #fef2f2; padding: 1rem; border-radius: 4px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>Tavo Development Server</h1>
+        <p>Route: <code>__TAVO_ROUTE__</code></p>
+        __TAVO_ERROR__
+        <p>SSR not available - using fallback HTML</p>
+        <div id="root"></div>
+    </div>
+    __TAVO_HMR__
+</body>
+</html>"""
+
 
 class DevServer:
     """Development server that creates and manages the complete ASGI application."""
@@ -49,6 +100,9 @@ class DevServer:
         self.ssr_renderer: Optional[SSRRenderer] = None
         self.api_router: Optional[FileBasedRouter] = None
         self.app_router: Optional[FileBasedRouter] = None
+        self._bundler_path: Optional[Path] = None
+        self._bundler_checked = False
+        self._fallback_template: Optional[str] = None
         
         # Project paths
         self.project_root = Path.cwd()
@@ -86,7 +140,7 @@ class DevServer:
             await self._start_integrated_server()
             
         except Exception as e:
-            logger.error(f"Failed to start dev server: {e}")
+            logger.error("Failed to start dev server: %s", e)
             await self.stop()
             raise
     
@@ -131,16 +185,26 @@ class DevServer:
         self.api_router = FileBasedRouter(self.api_dir, prefix="/api")
         self.app_router = FileBasedRouter(self.app_dir, renderer=self.ssr_renderer)
         
-        # Discover routes
-        await self.api_router.discover_routes()
-        await self.app_router.discover_routes()
+        # Discover routes; the two trees are independent, so overlap them
+        await asyncio.gather(
+            self.api_router.discover_routes(),
+            self.app_router.discover_routes(),
+        )
         
         # Create initial routes
-        initial_routes: list[Route | Mount] = [
+        initial_routes: list[Route | Mount] = []
+        
+        # API routes first; routes are discovered before the app exists, so
+        # the table is built in priority order up front
+        if self.api_router.routes:
+            initial_routes.append(Mount("/api", self.api_router.get_starlette_routes()))
+            logger.info("Mounted %s API routes", len(self.api_router.routes))
+        
+        initial_routes.extend([
             Route("/health", self._health_check),
             Route("/_routes", self._routes_info),
             Route("/_hmr", self._hmr_endpoint),
-        ]
+        ])
         
         # Add static files if public directory exists
         if self.public_dir.exists():
@@ -155,21 +219,15 @@ class DevServer:
         # Add middleware
         self.app.add_middleware(TavoMiddleware)
         
-        # Mount API routes
-        if self.api_router.routes:
-            api_mount = Mount("/api", self.api_router.get_starlette_routes())
-            self.app.router.routes.insert(0, api_mount)
-            logger.info(f"Mounted {len(self.api_router.routes)} API routes")
-        
-        # Add SSR catch-all route LAST
-        self.app.router.routes.append(Route("/{path:path}", self._ssr_handler))
+        # SSR handles whatever no other route matched
+        install_fallback_handler(self.app.router, self._ssr_handler)
         
         # Log route summary
         self._log_routes()
     
     async def _health_check(self, request: Request):
         """Health check endpoint."""
-        return JSONResponse({
+        return ORJSONResponse({
             "status": "healthy",
             "app": "Tavo Dev Server",
             "routes": {
@@ -192,19 +250,19 @@ class DevServer:
             if self.app_router:
                 page_routes = self.app_router.get_route_info()
             
-            return JSONResponse({
+            return ORJSONResponse({
                 "api": api_routes,
                 "pages": page_routes,
                 "total": len(api_routes) + len(page_routes)
             })
             
         except Exception as e:
-            logger.error(f"Error getting route info: {e}")
-            return JSONResponse({"error": str(e)}, status_code=500)
+            logger.error("Error getting route info: %s", e)
+            return ORJSONResponse({"error": str(e)}, status_code=500)
     
     async def _hmr_endpoint(self, request: Request):
         """HMR status endpoint."""
-        return JSONResponse({
+        return ORJSONResponse({
             "hmr": "enabled" if self.reload else "disabled",
             "websocket": f"ws://localhost:{self.port + 1}",
             "bundler_available": self._check_bundler_available(),
@@ -212,15 +270,15 @@ class DevServer:
     
     async def _not_found(self, request: Request):
         """Catch-all 404 handler."""
-        return JSONResponse({"error": "Route not found"}, status_code=404)
+        return ORJSONResponse({"error": "Route not found"}, status_code=404)
     
     async def _ssr_handler(self, request: Request):
         """SSR catch-all handler for page routes."""
         path = request.url.path
         
-        # Skip API routes
+        # Skip API routes (only mounted when there are any)
         if path.startswith('/api/'):
-            return JSONResponse({"error": "Route not found"}, status_code=404)
+            return ORJSONResponse({"error": "Route not found"}, status_code=404)
         
         try:
             # Check if the corresponding page file exists
@@ -256,7 +314,7 @@ class DevServer:
                 return HTMLResponse(content=fallback_html)
                 
         except Exception as e:
-            logger.error(f"SSR error for path '{path}': {e}")
+            logger.error("SSR error for path '%s': %s", path, e)
             fallback_html = self._get_fallback_html(path, error=str(e))
             return HTMLResponse(content=fallback_html, status_code=500)
 
@@ -271,39 +329,39 @@ class DevServer:
         Returns:
             Path to the page file if it exists, None otherwise
         """
-        logger.debug(f"Checking page file path for route: {path}")
-        logger.debug(f"App directory: {self.app_dir}")
-        logger.debug(f"App directory exists: {self.app_dir.exists()}")
+        # Runs per request; only pay for the diagnostics when they are logged
+        debug = logger.isEnabledFor(logging.DEBUG)
+        logger.debug("Checking page file path for route: %s", path)
         
         if not self.app_dir.exists():
-            logger.debug("App directory does not exist")
+            logger.debug("App directory does not exist: %s", self.app_dir)
             return None
         
         # List contents of app directory for debugging
-        if self.app_dir.exists():
+        if debug:
             app_contents = list(self.app_dir.iterdir())
-            logger.debug(f"App directory contents: {[f.name for f in app_contents]}")
+            logger.debug("App directory contents: %s", [f.name for f in app_contents])
         
         # Normalize path
         clean_path = path.strip('/')
-        logger.debug(f"Clean path: '{clean_path}'")
+        logger.debug("Clean path: '%s'", clean_path)
         
         # Handle root path
         if not clean_path:
             # Check for app/page.tsx or app/page.jsx
             for filename in ['page.tsx', 'page.jsx']:
                 page_file = self.app_dir / filename
-                logger.debug(f"Checking root page file: {page_file}")
-                logger.debug(f"Root page file exists: {page_file.exists()}")
-                if page_file.exists():
-                    logger.debug(f"Found root page file: {page_file}")
+                exists = page_file.exists()
+                logger.debug("Checking root page file: %s (exists: %s)", page_file, exists)
+                if exists:
+                    logger.debug("Found root page file: %s", page_file)
                     return page_file
             logger.debug("No root page file found")
             return None
         
         # Handle nested paths (e.g., "/about" -> "app/about/page.tsx")
         path_parts = clean_path.split('/')
-        logger.debug(f"Path parts: {path_parts}")
+        logger.debug("Path parts: %s", path_parts)
         
         # Only check for page.tsx and page.jsx in the directory structure
         for extension in ['tsx', 'jsx']:
@@ -312,10 +370,10 @@ class DevServer:
                 page_file = page_file / part
             page_file = page_file / f'page.{extension}'
             
-            logger.debug(f"Checking nested page file: {page_file}")
-            logger.debug(f"Nested page file exists: {page_file.exists()}")
-            if page_file.exists():
-                logger.debug(f"Found nested page file: {page_file}")
+            exists = page_file.exists()
+            logger.debug("Checking nested page file: %s (exists: %s)", page_file, exists)
+            if exists:
+                logger.debug("Found nested page file: %s", page_file)
                 return page_file
         
         logger.debug("No page file found for path")
@@ -429,51 +487,19 @@ class DevServer:
     </html>"""    
     def _get_fallback_html(self, path: str = "/", error: Optional[str] = None) -> str:
         """Generate fallback HTML when SSR fails."""
-        hmr_script = ""
-        if self.reload:
-            hmr_script = f"""
-<script>
-  // HMR WebSocket connection
-  const ws = new WebSocket('ws://localhost:{self.port + 1}');
-  ws.onmessage = (event) => {{
-    const data = JSON.parse(event.data);
-    if (data.type === 'reload') {{
-      window.location.reload();
-    }}
-  }};
-</script>"""
-        
-        error_message = f"<p>Error: {error}</p>" if error else ""
-        
-        return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Tavo App - {path}</title>
-    <style>
-        body {{ 
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-            margin: 0; padding: 2rem; background: #f5f5f5;
-        }}
-        .container {{ 
-            max-width: 600px; margin: 0 auto; background: white; 
-            padding: 2rem; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        .error {{ color: #dc2626; background: #fef2f2; padding: 1rem; border-radius: 4px; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>Tavo Development Server</h1>
-        <p>Route: <code>{path}</code></p>
-        {error_message}
-        <p>SSR not available - using fallback HTML</p>
-        <div id="root"></div>
-    </div>
-    {hmr_script}
-</body>
-</html>"""
+        if self._fallback_template is None:
+            hmr_script = ""
+            if self.reload:
+                hmr_script = _FALLBACK_HMR_SCRIPT.replace("__TAVO_HMR_PORT__", str(self.port + 1))
+            self._fallback_template = _FALLBACK_TEMPLATE.replace("__TAVO_HMR__", hmr_script)
+        
+        error_message = f"<p>Error: {html.escape(error)}</p>" if error else ""
+        
+        return (
+            self._fallback_template
+            .replace("__TAVO_ROUTE__", html.escape(path))
+            .replace("__TAVO_ERROR__", error_message)
+        )
     
     async def _start_hmr_server(self) -> None:
         """Start HMR WebSocket server."""
@@ -484,7 +510,7 @@ class DevServer:
         self.hmr_server = HMRWebSocketServer(port=hmr_port)
         await self.hmr_server.start()
         
-        logger.info(f"HMR server started on ws://localhost:{hmr_port}")
+        logger.info("HMR server started on ws://localhost:%s", hmr_port)
     
     async def _start_file_watcher(self) -> None:
         """Start file watcher for HMR."""
@@ -503,23 +529,31 @@ class DevServer:
                 hmr_server=self.hmr_server
             )
             await self.file_watcher.start()
-            logger.info(f"File watcher started for {len(watch_dirs)} directories")
+            logger.info("File watcher started for %s directories", len(watch_dirs))
     
     def _check_bundler_available(self) -> bool:
-        """Check if the Rust bundler binary is available."""
-        try:
-            get_bundler_path()
-            return True
-        except BundlerNotFound:
-            return False
+        """Check if the Rust bundler binary is available (resolved once)."""
+        if not self._bundler_checked:
+            try:
+                self._bundler_path = get_bundler_path()
+            except BundlerNotFound:
+                self._bundler_path = None
+            self._bundler_checked = True
+        return self._bundler_path is not None
+
+    def clear_bundler_path_cache(self) -> None:
+        """Forget the resolved bundler path so the next check probes again."""
+        get_bundler_path.cache_clear()
+        self._bundler_path = None
+        self._bundler_checked = False
       
     async def _start_integrated_server(self) -> None:
         """Start the integrated ASGI server."""
         if not self.app:
             raise RuntimeError("Application not created")
         
-        logger.info(f"Development server starting on http://{self.host}:{self.port}")
-        logger.info(f"Hot reload: {'enabled' if self.reload else 'disabled'}")
+        logger.info("Development server starting on http://%s:%s", self.host, self.port)
+        logger.info("Hot reload: %s", "enabled" if self.reload else "disabled")
         
         # Create uvicorn config
         config = uvicorn.Config(
@@ -543,12 +577,12 @@ class DevServer:
         try:
             await server.serve()
         except Exception as e:
-            logger.error(f"Server error: {e}")
+            logger.error("Server error: %s", e)
             raise
     
     def _log_routes(self) -> None:
         """Log registered routes."""
-        if not self.verbose:
+        if not self.verbose or not logger.isEnabledFor(logging.INFO):
             return
             
         logger.info("Registered routes:")
@@ -557,14 +591,14 @@ class DevServer:
             for route in self.app.routes:
                 if isinstance(route, Route):
                     methods = list(route.methods) if route.methods else ["GET"]
-                    logger.info(f"  {route.path} [{', '.join(methods)}]")
+                    logger.info("  %s [%s]", route.path, ", ".join(methods))
                 elif isinstance(route, Mount):
-                    logger.info(f"  Mount: {route.path}")
+                    logger.info("  Mount: %s", route.path)
                     if hasattr(route, 'routes'):
                         for sub_route in route.routes:
                             if isinstance(sub_route, Route):
                                 methods = list(sub_route.methods) if sub_route.methods else ["GET"]
-                                logger.info(f"    {sub_route.path} [{', '.join(methods)}]")
+                                logger.info("    %s [%s]", sub_route.path, ", ".join(methods))
 
 
 def start_dev_server(
@@ -584,12 +618,16 @@ def start_dev_server(
     """
     dev_server = DevServer(host, port, reload, verbose)
     
+    # uvicorn serves inside this loop rather than creating its own, so run it
+    # on uvloop directly; uvloop.run leaves the global event loop policy alone
+    run = uvloop.run if UVLOOP_AVAILABLE else asyncio.run
+    
     try:
-        asyncio.run(dev_server.start())
+        run(dev_server.start())
     except KeyboardInterrupt:
         logger.info("Development server stopped")
     except Exception as e:
-        logger.error(f"Development server error: {e}")
+        logger.error("Development server error: %s", e)
         raise
 
 
@@ -13,6 +13,7 @@ import re
 import hashlib
 import pickle
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Optional, Any, Dict, Tuple
 from dataclasses import dataclass
@@ -20,7 +21,9 @@ from dataclasses import dataclass
 from .installer import SWCInstaller
 from .resolver import ImportResolver
 from .layouts import LayoutComposer
-from .constants import DEFAULT_SWC_TIMEOUT, DIST_DIR, COMPILATION_TYPES
+from .constants import (
+    DEFAULT_SWC_TIMEOUT, DEFAULT_SOURCE_MAPS, DIST_DIR, COMPILATION_TYPES, DEFAULT_CACHE_MAX_ENTRIES
+)
 from .utils import read_file, write_file_atomic, safe_mkdir
 
 logger = logging.getLogger(__name__)
@@ -51,8 +54,9 @@ class CompilationResult:
 class SWCCompiler:
     """Compiles React/TypeScript components using SWC"""
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, max_cache_entries: int = DEFAULT_CACHE_MAX_ENTRIES):
         self.project_root = Path(project_root).resolve()
+        self.max_cache_entries = max_cache_entries
         self.installer = SWCInstaller()
         self.resolver = ImportResolver(project_root)
         self.composer = LayoutComposer()
@@ -77,15 +81,15 @@ class SWCCompiler:
             "total_time": 0.0
         }
 
-    def _load_cache_index(self) -> Dict[str, CacheEntry]:
-        """Load cache index from disk"""
+    def _load_cache_index(self) -> "OrderedDict[str, CacheEntry]":
+        """Load cache index from disk (least recently used first)"""
         if self.cache_index_file.exists():
             try:
                 with open(self.cache_index_file, 'rb') as f:
                     cache_data = pickle.load(f)
                 
                 # Handle backward compatibility for old cache entries
-                updated_cache = {}
+                updated_cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
                 for key, entry in cache_data.items():
                     if hasattr(entry, 'bundled_tsx'):
                         updated_cache[key] = entry
@@ -102,6 +106,7 @@ class SWCCompiler:
                         )
                         updated_cache[key] = new_entry
                 
+                self._evict_cache_entries(updated_cache)
                 return updated_cache
                 
             except Exception as e:
@@ -111,7 +116,18 @@ class SWCCompiler:
                     logger.info("Cleared corrupted cache index")
                 except:
                     pass
-        return {}
+        return OrderedDict()
+
+    def _evict_cache_entries(self, cache_index: "OrderedDict[str, CacheEntry]") -> None:
+        """Drop least recently used entries beyond max_cache_entries"""
+        while len(cache_index) > self.max_cache_entries:
+            key, _ = cache_index.popitem(last=False)
+            debug_file = self.debug_dir / f"{key[:12]}_bundled.tsx"
+            try:
+                debug_file.unlink()
+            except OSError:
+                pass
+            logger.debug("Evicted compilation cache entry: %s...", key[:8])
 
     def _save_cache_index(self):
         """Save cache index to disk"""
@@ -179,17 +195,20 @@ class SWCCompiler:
         )
         
         self._cache_index[cache_key] = entry
+        self._cache_index.move_to_end(cache_key)
+        self._evict_cache_entries(self._cache_index)
         self._save_cache_index()
         
         # Save debug file
         debug_file = self.debug_dir / f"{cache_key[:12]}_bundled.tsx"
         write_file_atomic(debug_file, bundled_tsx)
-        logger.info(f"Stored bundled TSX for debugging: {debug_file}")
+        logger.info("Stored bundled TSX for debugging: %s", debug_file)
 
     def _get_from_cache(self, cache_key: str) -> Optional[Tuple[str, str]]:
         """Retrieve compilation result from cache"""
         if cache_key in self._cache_index:
             entry = self._cache_index[cache_key]
+            self._cache_index.move_to_end(cache_key)
             bundled_tsx = getattr(entry, 'bundled_tsx', "")
             
             # Restore debug file if we have content
@@ -197,7 +216,7 @@ class SWCCompiler:
                 debug_file = self.debug_dir / f"{cache_key[:12]}_bundled.tsx"
                 write_file_atomic(debug_file, bundled_tsx)
             
-            logger.debug(f"Using cached compilation result: {cache_key[:8]}...")
+            logger.debug("Using cached compilation result: %s...", cache_key[:8])
             return entry.compiled_js, bundled_tsx
         return None
 
@@ -291,7 +310,7 @@ class SWCCompiler:
             },
             "minify": compilation_type == "production",
             "isModule": True,
-            "sourceMaps": os.getenv("TAVO_SOURCE_MAPS", "false").lower() == "true"
+            "sourceMaps": DEFAULT_SOURCE_MAPS
         }
         
         return base_config
@@ -401,7 +420,7 @@ class SWCCompiler:
         ]
 
         env = os.environ.copy()
-        timeout = int(os.getenv('TAVO_SWC_TIMEOUT', DEFAULT_SWC_TIMEOUT))
+        timeout = DEFAULT_SWC_TIMEOUT
 
         try:
             # Run SSR
@@ -513,7 +532,7 @@ class SWCCompiler:
             env = os.environ.copy()
             env['NODE_ENV'] = 'production' if compilation_type == 'production' else 'development'
 
-            timeout = int(os.getenv('TAVO_SWC_TIMEOUT', DEFAULT_SWC_TIMEOUT))
+            timeout = DEFAULT_SWC_TIMEOUT
             
             result = subprocess.run(
                 cmd,
@@ -575,7 +594,7 @@ class SWCCompiler:
         
         if not cache_hit:
             # Compile if not in cache or cache is invalid
-            logger.info(f"Compiling {len(files)} files (cache miss)")
+            logger.info("Compiling %s files (cache miss)", len(files))
             compiled_js, bundled_tsx = self._compile_with_swc(files, compilation_type)
             
             # Store result in cache
@@ -598,7 +617,7 @@ class SWCCompiler:
             output_size=len(compiled_js.encode('utf-8'))
         )
         
-        logger.info(f"Compiled {path} in {compilation_time:.2f}s (cache_hit={cache_hit})")
+        logger.info("Compiled %s in %.2fs (cache_hit=%s)", path, compilation_time, cache_hit)
         return result
 
     def compile_for_ssr(self, files: List[Path], path: str) -> CompilationResult:
@@ -28,6 +28,8 @@ DEFAULT_SWC_TIMEOUT = int(os.getenv("TAVO_SWC_TIMEOUT", "30"))
 DEFAULT_SWC_COMMAND = os.getenv("TAVO_SWC_CMD", "swc")
 DEFAULT_CACHE_DIR = os.getenv("TAVO_CACHE_DIR", TAVO_CACHE_DIR)
 DEFAULT_DEV_PORT = int(os.getenv("TAVO_DEV_PORT", "3000"))
+DEFAULT_SSR_WORKERS = int(os.getenv("TAVO_SSR_WORKERS", str(min(4, os.cpu_count() or 1))))
+DEFAULT_SOURCE_MAPS = os.getenv("TAVO_SOURCE_MAPS", "false").lower() == "true"
 
 # Build configuration
 BUILD_MODES = {"development", "production"}
@@ -15,8 +15,9 @@ import threading
 from .compiler import SWCCompiler
 from .resolver import ImportResolver
 from .templates import TemplateManager
-from .constants import DEFAULT_DEV_PORT, HMR_WEBSOCKET_PATH
-from .utils import write_file_atomic, safe_mkdir
+from .constants import DEFAULT_DEV_PORT, DEFAULT_SSR_WORKERS, HMR_WEBSOCKET_PATH
+from .utils import write_file_atomic, safe_mkdir, dumps_json
+from .ssr_worker import SSRWorkerPool, SSRWorkerError
 
 logger = logging.getLogger(__name__)
 
@@ -30,28 +31,31 @@ class HMRWebSocketHandler:
     def add_client(self, client):
         """Add WebSocket client"""
         self.clients.add(client)
-        logger.debug(f"HMR client connected. Total: {len(self.clients)}")
+        logger.debug("HMR client connected. Total: %s", len(self.clients))
     
     def remove_client(self, client):
         """Remove WebSocket client"""
         self.clients.discard(client)
-        logger.debug(f"HMR client disconnected. Total: {len(self.clients)}")
+        logger.debug("HMR client disconnected. Total: %s", len(self.clients))
     
     def broadcast(self, message: Dict[str, Any]):
         """Broadcast message to all connected clients"""
         if not self.clients:
             return
         
-        message_str = json.dumps(message)
+        # Only pay for encoding the payload when it will actually be logged
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        message_str = json.dumps(message) if debug_enabled else ""
         disconnected_clients = set()
         
         for client in self.clients:
             try:
                 # This is a placeholder - in production would use actual WebSocket library
                 # For now just log the message that would be sent
-                logger.debug(f"Broadcasting HMR message: {message_str}")
+                if debug_enabled:
+                    logger.debug("Broadcasting HMR message: %s", message_str)
             except Exception as e:
-                logger.warning(f"Failed to send HMR message to client: {e}")
+                logger.warning("Failed to send HMR message to client: %s", e)
                 disconnected_clients.add(client)
         
         # Remove disconnected clients
@@ -68,6 +72,8 @@ class DevServer:
         self.templates = TemplateManager(project_root)
         
         self.hmr_handler = HMRWebSocketHandler()
+        self._ssr_workers: Optional[SSRWorkerPool] = None
+        self._ssr_worker_lock = threading.Lock()
         self.server: Optional[HTTPServer] = None
         self.server_thread: Optional[threading.Thread] = None
         
@@ -94,7 +100,7 @@ class DevServer:
             logger.warning("Dev server is already running")
             return
         
-        logger.info(f"Starting development server on http://{host}:{port}")
+        logger.info("Starting development server on http://%s:%s", host, port)
         
         # Create request handler with reference to this server
         def handler_factory(*args, **kwargs):
@@ -111,7 +117,7 @@ class DevServer:
             )
             self.server_thread.start()
             
-            logger.info(f"Development server started successfully on http://{host}:{port}")
+            logger.info("Development server started successfully on http://%s:%s", host, port)
             
             # Initial build
             self._initial_build()
@@ -128,7 +134,7 @@ class DevServer:
                 self.stop()
             
         except Exception as e:
-            logger.error(f"Failed to start development server: {e}")
+            logger.error("Failed to start development server: %s", e)
             self.is_running = False
             raise
     
@@ -148,6 +154,9 @@ class DevServer:
         if self.server_thread and self.server_thread.is_alive():
             self.server_thread.join(timeout=5.0)
         
+        if self._ssr_workers:
+            self._ssr_workers.close()
+        
         logger.info("Development server stopped")
     
     def _initial_build(self) -> None:
@@ -169,12 +178,12 @@ class DevServer:
                     built_count += 1
                     
                 except Exception as e:
-                    logger.error(f"Failed to build route {route.route_path}: {e}")
+                    logger.error("Failed to build route %s: %s", route.route_path, e)
             
-            logger.info(f"Initial build completed: {built_count}/{len(routes)} routes")
+            logger.info("Initial build completed: %s/%s routes", built_count, len(routes))
             
         except Exception as e:
-            logger.error(f"Initial build failed: {e}")
+            logger.error("Initial build failed: %s", e)
     
     def _setup_file_watching(self) -> None:
         """Setup file watching for hot reloading"""
@@ -192,7 +201,7 @@ class DevServer:
         
         self._last_rebuild_time = current_time
         
-        logger.info(f"Files changed: {[str(f) for f in changed_files]}")
+        logger.info("Files changed: %s", [str(f) for f in changed_files])
         
         try:
             # Find affected routes
@@ -219,7 +228,7 @@ class DevServer:
                     })
                     
                 except Exception as e:
-                    logger.error(f"Failed to rebuild route {route.route_path}: {e}")
+                    logger.error("Failed to rebuild route %s: %s", route.route_path, e)
             
             # Notify HMR clients
             if rebuilt_routes:
@@ -235,12 +244,12 @@ class DevServer:
                 try:
                     callback(changed_files)
                 except Exception as e:
-                    logger.error(f"Change callback failed: {e}")
+                    logger.error("Change callback failed: %s", e)
             
-            logger.info(f"Hot reload completed: {len(rebuilt_routes)} routes updated")
+            logger.info("Hot reload completed: %s routes updated", len(rebuilt_routes))
             
         except Exception as e:
-            logger.error(f"Failed to handle file changes: {e}")
+            logger.error("Failed to handle file changes: %s", e)
     
     def _find_affected_routes(self, changed_files: List[Path]) -> List:
         """Find routes affected by changed files"""
@@ -274,15 +283,16 @@ class DevServer:
 
             # Compile route for both SSR + Hydration
             route_files = list(matching_route.all_files)
-            logger.info(f"Compiling {matching_route.route_path} for SSR + Hydration")
+            logger.info("Compiling %s for SSR + Hydration", matching_route.route_path)
             outputs = self.compiler.compile_for_ssr_and_hydration(route_files, matching_route.route_path)
 
             ssr_compiled_js = outputs["ssr"].compiled_js
             hydration_compiled_js = outputs["hydration"].compiled_js
 
-            # Prepare for SSR execution
+            # Prepare for SSR execution; the context is encoded once for
+            # both the node worker props and the embedded initial state
             ssr_html_content = ""
-            serialized_context = json.dumps(context) if context else "{}"
+            serialized_context = dumps_json(context) if context else "{}"
 
             safe_mkdir(self.compiler.debug_dir)
             safe_filename = path.replace('/', '_').strip('_') or 'index'
@@ -290,49 +300,12 @@ class DevServer:
             # Write SSR JS into temp file
             ssr_temp_file = self.compiler.debug_dir / f"ssr_entry__{safe_filename}.cjs"
             write_file_atomic(ssr_temp_file, ssr_compiled_js)
-            ssr_temp_file_uri = ssr_temp_file.as_uri()
-
-            # Node executor for SSR
-            ssr_executor_script = f"""
-    import React from 'react';
-    import ReactDOMServer from 'react-dom/server';
-    import * as Component from '{ssr_temp_file_uri}';
-
-    const initialProps = JSON.parse(process.argv[2] || '{{}}');
-
-    try {{
-        const element = React.createElement(Component.default, initialProps);
-        const html = ReactDOMServer.renderToString(element);
-        console.log(html);
-    }} catch (e) {{
-        console.error(JSON.stringify({{ message: e.message, stack: e.stack }}));
-        process.exit(1);
-    }}
-    """
-            ssr_executor_temp_file = self.compiler.debug_dir / "ssr_executor.mjs"
-            write_file_atomic(ssr_executor_temp_file, ssr_executor_script)
 
-            # Run Node SSR
+            # Run Node SSR on a persistent worker
             try:
-                node_command = ["node", str(ssr_executor_temp_file), serialized_context]
-                logger.debug(f"Executing Node.js SSR: {' '.join(node_command)}")
-
-                ssr_process = subprocess.run(
-                    node_command,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                    cwd=self.project_root,
-                    encoding='utf-8',
-                    timeout=10
-                )
-                ssr_html_content = ssr_process.stdout.strip()
-
-                if ssr_process.stderr:
-                    logger.warning(f"Node.js SSR stderr: {ssr_process.stderr.strip()}")
-
-            except subprocess.CalledProcessError as e:
-                logger.error(f"Node.js SSR execution failed (code {e.returncode}): {e.stderr.strip()}")
+                ssr_html_content = self._get_ssr_workers().render(ssr_temp_file, serialized_context).strip()
+            except SSRWorkerError as e:
+                logger.error("Node.js SSR execution failed: %s", e)
                 ssr_html_content = ""
             except subprocess.TimeoutExpired:
                 logger.error("Node.js SSR execution timed out.")
@@ -341,14 +314,15 @@ class DevServer:
                 logger.error("Node.js not found. Cannot perform SSR execution.")
                 ssr_html_content = ""
             except Exception as e:
-                logger.error(f"Unexpected error during Node.js SSR execution: {e}")
+                logger.error("Unexpected error during Node.js SSR execution: %s", e)
                 ssr_html_content = ""
 
             # Render HTML with template engine
             html = self.templates.render_html(
                 ssr_html=ssr_html_content,
                 state=context if context else {},
-                hydration_compiled_js=hydration_compiled_js
+                hydration_compiled_js=hydration_compiled_js,
+                state_json=serialized_context
             )
 
             # Inject HMR in dev
@@ -356,9 +330,21 @@ class DevServer:
             return html
 
         except Exception as e:
-            logger.exception(f"Error serving route {path}: {e}")
+            logger.exception("Error serving route %s: %s", path, e)
             return self.render_error_page(str(e))
 
+    def _get_ssr_workers(self) -> SSRWorkerPool:
+        """Get the node SSR worker pool, creating it on first use"""
+        if self._ssr_workers is None:
+            with self._ssr_worker_lock:
+                if self._ssr_workers is None:
+                    self._ssr_workers = SSRWorkerPool(
+                        self.compiler.debug_dir / "ssr_worker.mjs",
+                        cwd=self.project_root,
+                        size=DEFAULT_SSR_WORKERS
+                    )
+        return self._ssr_workers
+
     def render_error_page(self, error_message: str) -> str:
         """Render error page"""
         return self.templates.render_error_page(error_message)
@@ -430,7 +416,7 @@ class DevRequestHandler(SimpleHTTPRequestHandler):
             else:
                 self.send_error(404, f"File not found: {path}")
         except Exception as e:
-            logger.error(f"Error serving built file {path}: {e}")
+            logger.error("Error serving built file %s: %s", path, e)
             self.send_error(500, str(e))
     
     def serve_public_file(self, path: str):
@@ -455,7 +441,7 @@ class DevRequestHandler(SimpleHTTPRequestHandler):
             else:
                 self.send_error(404, f"Public file not found: {path}")
         except Exception as e:
-            logger.error(f"Error serving public file {path}: {e}")
+            logger.error("Error serving public file %s: %s", path, e)
             self.send_error(500, str(e))
     
     def serve_route(self, path: str):
@@ -474,7 +460,7 @@ class DevRequestHandler(SimpleHTTPRequestHandler):
             self.wfile.write(html_content.encode('utf-8'))
             
         except Exception as e:
-            logger.error(f"Error serving route {path}: {e}")
+            logger.error("Error serving route %s: %s", path, e)
             error_html = self.dev_server.render_error_page(str(e))
             
             self.send_response(500)
@@ -484,4 +470,4 @@ class DevRequestHandler(SimpleHTTPRequestHandler):
     
     def log_message(self, format, *args):
         """Override to use our logger"""
-        logger.info(f"HTTP {format % args}")
+        logger.info("HTTP " + format, *args)
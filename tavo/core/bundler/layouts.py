@@ -403,10 +403,11 @@ class LayoutComposer:
         """Generate the final composed component with enhanced logic"""
         lines = []
         
-        # Collect all unique imports
-        all_imports = set()
-        for comp in components:
-            all_imports.update(comp.extracted_imports)
+        # Collect all unique imports; dict.fromkeys keeps first-seen order, so
+        # the composed source (and its compile cache key) is stable across runs
+        all_imports = list(dict.fromkeys(
+            imp for comp in components for imp in comp.extracted_imports
+        ))
         
         # Ensure React import is present
         react_imported = any('from "react"' in imp or "from 'react'" in imp for imp in all_imports)
@@ -414,7 +415,7 @@ class LayoutComposer:
             lines.append('import React from "react";')
         
         # Add other imports (deduplicated)
-        unique_imports = self._deduplicate_imports(list(all_imports))
+        unique_imports = self._deduplicate_imports(all_imports)
         lines.extend(unique_imports)
         
         if unique_imports:
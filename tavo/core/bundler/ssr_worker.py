@@ -0,0 +1,257 @@
+"""
+Persistent Node.js worker for server-side rendering
+"""
+
+import json
+import logging
+import queue
+import subprocess
+import threading
+from pathlib import Path
+from typing import Optional, Tuple
+
+from .utils import write_file_atomic, loads_json
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+if MSGSPEC_AVAILABLE:
+    class _WorkerError(msgspec.Struct):
+        message: str = "unknown error"
+
+    class _WorkerResponse(msgspec.Struct):
+        id: int = 0
+        html: str = ""
+        error: Optional[_WorkerError] = None
+
+    _decode_response = msgspec.json.Decoder(_WorkerResponse).decode
+
+
+def _parse_response(line: bytes) -> Tuple[int, str, Optional[str]]:
+    """
+    Decode one worker response line into (id, html, error message)
+
+    With msgspec the line is validated straight into a typed struct instead
+    of building a generic dict. Raises ValueError for non-protocol output.
+    """
+    if MSGSPEC_AVAILABLE:
+        try:
+            response = _decode_response(line)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+        error = response.error.message if response.error is not None else None
+        return response.id, response.html, error
+
+    response = loads_json(line)
+    if not isinstance(response, dict):
+        raise ValueError("SSR worker response is not an object")
+    error = response.get("error")
+    if error is not None:
+        error = error.get("message", "unknown error")
+    return response.get("id", 0), response.get("html", ""), error
+
+
+# Renders compiled (CommonJS) SSR modules; one JSON request/response per line
+WORKER_SCRIPT = r"""
+import { createRequire } from 'module';
+import readline from 'readline';
+
+const require = createRequire(import.meta.url);
+const React = require('react');
+const ReactDOMServer = require('react-dom/server');
+
+// stdout carries the protocol; send component logging to stderr
+console.log = console.info = console.debug = (...args) => console.error(...args);
+
+const send = (message) => process.stdout.write(JSON.stringify(message) + '\n');
+
+readline.createInterface({ input: process.stdin }).on('line', (line) => {
+    let request;
+    try {
+        request = JSON.parse(line);
+    } catch (e) {
+        return;
+    }
+
+    try {
+        // Entry files are rewritten between renders; always load the current one
+        const file = require.resolve(request.file);
+        delete require.cache[file];
+        const Component = require(file);
+        const element = React.createElement(Component, request.props || {});
+        send({ id: request.id, html: ReactDOMServer.renderToString(element) });
+    } catch (e) {
+        send({ id: request.id, error: { message: e.message, stack: e.stack } });
+    }
+});
+"""
+
+
+class SSRWorkerError(RuntimeError):
+    """Raised when the SSR worker cannot render a module"""
+
+
+class SSRWorker:
+    """
+    Long-lived node process that renders compiled SSR modules
+
+    Node startup and React loading are paid once instead of on every render.
+    Requests are serialized; the process is restarted if it exits or times out.
+    """
+
+    def __init__(self, script_path: Path, cwd: Path, timeout: float = 10.0):
+        self.script_path = Path(script_path)
+        self.cwd = Path(cwd)
+        self.timeout = timeout
+
+        self._process: Optional[subprocess.Popen] = None
+        self._responses: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._next_id = 0
+
+    def render(self, module_path: Path, serialized_props: str = "{}") -> str:
+        """
+        Render a compiled SSR module to an HTML string
+
+        Args:
+            module_path: Path to the compiled CommonJS module
+            serialized_props: JSON-encoded props for the root component
+
+        Returns:
+            Rendered HTML
+
+        Raises:
+            SSRWorkerError: If the component fails to render or the worker dies
+            subprocess.TimeoutExpired: If no response arrives within the timeout
+            FileNotFoundError: If node is not installed
+        """
+        with self._lock:
+            if self._process is None or self._process.poll() is not None:
+                self._start()
+
+            self._next_id += 1
+            request_id = self._next_id
+            request = '{"id": %d, "file": %s, "props": %s}\n' % (
+                request_id, json.dumps(str(module_path)), serialized_props or "{}"
+            )
+
+            try:
+                self._process.stdin.write(request.encode("utf-8"))
+                self._process.stdin.flush()
+            except OSError as e:
+                self._stop()
+                raise SSRWorkerError(f"SSR worker is not accepting requests: {e}") from e
+
+            while True:
+                try:
+                    line = self._responses.get(timeout=self.timeout)
+                except queue.Empty:
+                    self._stop()
+                    raise subprocess.TimeoutExpired(["node", str(self.script_path)], self.timeout)
+
+                if line is None:
+                    self._stop()
+                    raise SSRWorkerError("SSR worker exited unexpectedly")
+
+                try:
+                    response_id, html, error = _parse_response(line)
+                except ValueError:
+                    logger.debug("Ignoring SSR worker output: %r", line.rstrip())
+                    continue
+
+                if response_id != request_id:
+                    continue
+
+                if error is not None:
+                    raise SSRWorkerError(error)
+
+                return html
+
+    def close(self) -> None:
+        """Terminate the worker process"""
+        with self._lock:
+            self._stop()
+
+    def _start(self) -> None:
+        """Write the worker script and spawn node"""
+        write_file_atomic(self.script_path, WORKER_SCRIPT)
+
+        self._process = subprocess.Popen(
+            ["node", str(self.script_path)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=self.cwd
+        )
+        self._responses = queue.Queue()
+
+        threading.Thread(
+            target=self._read_stdout, args=(self._process, self._responses), daemon=True
+        ).start()
+        threading.Thread(
+            target=self._read_stderr, args=(self._process,), daemon=True
+        ).start()
+
+        logger.debug("Started SSR worker (pid %s)", self._process.pid)
+
+    def _stop(self) -> None:
+        """Terminate the current process, if any"""
+        process, self._process = self._process, None
+        if process is None or process.poll() is not None:
+            return
+
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+    @staticmethod
+    def _read_stdout(process: subprocess.Popen, responses: "queue.Queue[Optional[bytes]]") -> None:
+        # Raw bytes: responses are parsed straight from UTF-8 without decoding first
+        for line in process.stdout:
+            responses.put(line)
+        responses.put(None)
+
+    @staticmethod
+    def _read_stderr(process: subprocess.Popen) -> None:
+        for line in process.stderr:
+            line = line.rstrip()
+            if line:
+                logger.warning("Node.js SSR stderr: %s", line.decode("utf-8", "replace"))
+
+
+class SSRWorkerPool:
+    """
+    Fixed set of SSR workers shared by concurrent renders
+
+    Each render borrows an idle worker, so at most `size` node processes
+    run at once no matter how many requests arrive. Idle workers are reused
+    most-recent-first, so extra processes only start under real concurrency.
+    """
+
+    def __init__(self, script_path: Path, cwd: Path, size: int, timeout: float = 10.0):
+        self.size = max(1, size)
+        self._workers = [SSRWorker(script_path, cwd, timeout) for _ in range(self.size)]
+        self._idle: "queue.LifoQueue[SSRWorker]" = queue.LifoQueue()
+        for worker in self._workers:
+            self._idle.put(worker)
+
+    def render(self, module_path: Path, serialized_props: str = "{}") -> str:
+        """Render on the next idle worker (see SSRWorker.render)"""
+        worker = self._idle.get()
+        try:
+            return worker.render(module_path, serialized_props)
+        finally:
+            self._idle.put(worker)
+
+    def close(self) -> None:
+        """Terminate all worker processes"""
+        for worker in self._workers:
+            worker.close()
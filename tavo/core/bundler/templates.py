@@ -2,18 +2,24 @@
 HTML templates and HMR client scripts
 """
 
-import json
 import logging
+import re
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 from .constants import (
     SSR_HTML_PLACEHOLDER, INITIAL_STATE_PLACEHOLDER, 
     CLIENT_BUNDLE_PLACEHOLDER, HMR_SCRIPT_PLACEHOLDER
 )
+from .utils import dumps_json
 
 logger = logging.getLogger(__name__)
 
+_RENDER_PLACEHOLDER_RE = re.compile("(%s)" % "|".join(map(re.escape, (
+    SSR_HTML_PLACEHOLDER, INITIAL_STATE_PLACEHOLDER,
+    CLIENT_BUNDLE_PLACEHOLDER, HMR_SCRIPT_PLACEHOLDER
+))))
+
 
 class TemplateManager:
     """Manages HTML templates and client scripts"""
@@ -22,6 +28,7 @@ class TemplateManager:
         self.project_root = Path(project_root).resolve()
         self._base_template: Optional[str] = None
         self._error_template: Optional[str] = None
+        self._render_parts: Optional[Tuple[str, List[str], List[Tuple[int, str]]]] = None
     
     def get_base_template(self) -> str:
         """Get the base HTML template"""
@@ -149,27 +156,51 @@ class TemplateManager:
 </body>
 </html>'''
     
-    def render_html(self, ssr_html: str, state: Dict[str, Any], hydration_compiled_js: str) -> str:
+    def render_html(self, ssr_html: str, state: Dict[str, Any], hydration_compiled_js: str,
+                    state_json: Optional[str] = None) -> str:
         """
         Render complete HTML page
         
         Args:
             ssr_html: Server-side rendered HTML content
             state: Initial application state
-            client_script_path: Path to client bundle
+            hydration_compiled_js: Compiled client bundle
+            state_json: State already serialized by the caller; skips encoding it again
             
         Returns:
             Complete HTML document
         """
+        parts, slots = self._get_render_parts()
+        
+        if state_json is None:
+            state_json = dumps_json(state)
+        
+        values = {
+            SSR_HTML_PLACEHOLDER: ssr_html,
+            INITIAL_STATE_PLACEHOLDER: state_json,
+            CLIENT_BUNDLE_PLACEHOLDER: hydration_compiled_js,
+            HMR_SCRIPT_PLACEHOLDER: "",  # Will be filled by inject_hmr_script if needed
+        }
+        
+        # Fill the slots of the pre-split template and join once, instead of
+        # scanning and copying the whole page for every placeholder
+        html_parts = parts.copy()
+        for index, placeholder in slots:
+            html_parts[index] = values[placeholder]
+        
+        return "".join(html_parts)
+    
+    def _get_render_parts(self) -> Tuple[List[str], List[Tuple[int, str]]]:
+        """Split the base template into constant chunks and placeholder slots"""
         template = self.get_base_template()
         
-        # Replace placeholders
-        html = template.replace(SSR_HTML_PLACEHOLDER, ssr_html)
-        html = html.replace(INITIAL_STATE_PLACEHOLDER, json.dumps(state))
-        html = html.replace(CLIENT_BUNDLE_PLACEHOLDER, hydration_compiled_js)
-        html = html.replace(HMR_SCRIPT_PLACEHOLDER, "")  # Will be filled by inject_hmr_script if needed
+        if self._render_parts is None or self._render_parts[0] is not template:
+            parts = _RENDER_PLACEHOLDER_RE.split(template)
+            # re.split with a group puts the placeholders at the odd indexes
+            slots = [(index, parts[index]) for index in range(1, len(parts), 2)]
+            self._render_parts = (template, parts, slots)
         
-        return html
+        return self._render_parts[1], self._render_parts[2]
     
     def render_error_page(self, error_message: str) -> str:
         """
@@ -198,9 +229,13 @@ class TemplateManager:
         
         if HMR_SCRIPT_PLACEHOLDER in html:
             return html.replace(HMR_SCRIPT_PLACEHOLDER, hmr_script)
-        else:
-            # Fallback: inject before closing body tag
-            return html.replace("</body>", f"{hmr_script}\n</body>")
+        
+        # Fallback: splice in before the closing body tag. SSR output can be
+        # large, so locate the single tag from the end instead of replace()
+        body_end = html.rfind("</body>")
+        if body_end == -1:
+            return html
+        return "".join((html[:body_end], hmr_script, "\n", html[body_end:]))
     
     def _get_hmr_client_script(self) -> str:
         """Get HMR client script"""
@@ -7,8 +7,15 @@ import shutil
 import tempfile
 import logging
 from pathlib import Path
-from typing import Union, Optional
+from typing import Any, Union, Optional
 import json
+from collections.abc import Mapping
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Setup module logger
 logger = logging.getLogger(__name__)
@@ -248,6 +255,64 @@ def load_json_file(file_path: Union[str, Path], default: Optional[dict] = None)
         return default or {}
 
 
+def _json_default(obj: Any) -> Any:
+    """
+    Encode values JSON has no native form for
+    
+    Called by the encoder only for unsupported leaves, so plain data is
+    traversed entirely in C.
+    """
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if callable(obj):
+        return None
+    if hasattr(obj, '__dict__'):
+        return vars(obj)
+    text = str(obj)
+    return text if len(text) < 500 else text[:100] + '...'
+
+
+def dumps_json(data: Any) -> str:
+    """
+    Serialize data to a compact JSON string, using orjson when installed
+    
+    Objects JSON can't represent are converted by _json_default rather
+    than failing the whole document.
+    
+    Args:
+        data: Data to serialize
+        
+    Returns:
+        JSON text
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                data, default=_json_default, option=orjson.OPT_NON_STR_KEYS
+            ).decode('utf-8')
+        except TypeError:
+            # e.g. integers beyond 64 bits; stdlib json handles those
+            pass
+    return json.dumps(data, default=_json_default)
+
+
+def loads_json(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text or UTF-8 bytes, using orjson when installed
+    
+    Args:
+        data: JSON document; bytes are parsed without a separate decode step
+        
+    Returns:
+        Parsed data
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def save_json_file(file_path: Union[str, Path], data: dict, indent: int = 2) -> bool:
     """
     Save data to JSON file safely
@@ -49,8 +49,9 @@ class TavoMiddleware(BaseHTTPMiddleware):
             Response object with potential modifications
         """
         # Log request start
-        start_time = time.time()
-        self.logger.debug(f"Request started: {request.method} {request.url.path}")
+        # Integer nanosecond clock: monotonic, and no float until formatting
+        start_ns = time.perf_counter_ns()
+        self.logger.debug("Request started: %s %s", request.method, request.url.path)
 
         try:
             # Add HMR headers for development
@@ -61,13 +62,13 @@ class TavoMiddleware(BaseHTTPMiddleware):
 
             # Add custom Tavo headers
             response.headers["X-Tavo-Version"] = "{{PROJECT_NAME}}-v1.0.0"
-            response.headers["X-Response-Time"] = f"{(time.time() - start_time) * 1000:.2f}ms"
+            response.headers["X-Response-Time"] = f"{(time.perf_counter_ns() - start_ns) / 1_000_000:.2f}ms"
 
             # Log request completion
             self.logger.debug(
-                f"Request completed: {request.method} {request.url.path} "
-                f"Status: {response.status_code} "
-                f"Time: {response.headers['X-Response-Time']}"
+                "Request completed: %s %s Status: %s Time: %s",
+                request.method, request.url.path, response.status_code,
+                response.headers["X-Response-Time"]
             )
 
             return response
@@ -12,6 +12,12 @@ import json
 import re
 import uuid
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # Type variables for better type hinting
@@ -823,22 +829,36 @@ class JSONField(Field[Any]):
         
         try:
             # Test JSON serialization
-            json.dumps(value, cls=self.encoder) # type: ignore
+            self._dumps(value)
             return value
         except (TypeError, ValueError) as e:
             raise ValueError(f"Value is not JSON serializable: {e}")
     
+    def _dumps(self, value: Any) -> str:
+        """
+        Serialize to JSON with the stdlib encoder.
+        
+        orjson would write NaN/Infinity as null and accept types the stdlib
+        rejects, so stored text keeps one format whether or not it is installed.
+        """
+        return json.dumps(value, cls=self.encoder) # type: ignore
+    
     def to_db_value(self, value: Any) -> Optional[str]:
         """Convert to JSON string for database."""
         if value is None:
             return None
-        return json.dumps(value, cls=self.encoder) # type: ignore
+        return self._dumps(value)
     
     def from_db_value(self, value: Any) -> Any:
         """Convert from JSON string to Python object."""
         if value is None or value == '':
             return None
         if isinstance(value, str):
+            if ORJSON_AVAILABLE:
+                try:
+                    return orjson.loads(value)
+                except orjson.JSONDecodeError:
+                    pass  # e.g. NaN, which only the stdlib parser accepts
             try:
                 return json.loads(value)
             except json.JSONDecodeError:
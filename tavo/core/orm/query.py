@@ -6,6 +6,8 @@ Enhanced query builder with advanced features, better type safety, and comprehen
 
 import asyncio
 import logging
+import sys
+from array import array
 from typing import Any, Dict, List, Optional, Union, Tuple, Type, TypeVar
 from dataclasses import dataclass, field
 from enum import Enum
@@ -17,6 +19,20 @@ logger = logging.getLogger(__name__)
 T = TypeVar('T')
 ModelType = TypeVar('ModelType', bound='BaseModel') # type: ignore
 
+# Fixed SQL tokens, interned once so query building reuses the same objects
+_SQL_WITH = sys.intern("WITH ")
+_SQL_SELECT = sys.intern("SELECT ")
+_SQL_DISTINCT = sys.intern("DISTINCT ")
+_SQL_FROM = sys.intern(" FROM ")
+_SQL_WHERE = sys.intern(" WHERE ")
+_SQL_AND = sys.intern(" AND ")
+_SQL_GROUP_BY = sys.intern(" GROUP BY ")
+_SQL_HAVING = sys.intern(" HAVING ")
+_SQL_ORDER_BY = sys.intern(" ORDER BY ")
+_SQL_LIMIT = sys.intern(" LIMIT ")
+_SQL_OFFSET = sys.intern(" OFFSET ")
+_SQL_COMMA = sys.intern(", ")
+
 
 class QueryError(Exception):
     """Base exception for query-related errors."""
@@ -68,6 +84,35 @@ class SortOrder(Enum):
     DESC = "DESC"
 
 
+# Operator groups used when rendering conditions
+_NULL_OPERATORS = frozenset((Operator.IS_NULL, Operator.IS_NOT_NULL))
+_IN_OPERATORS = frozenset((Operator.IN, Operator.NOT_IN))
+_BETWEEN_OPERATORS = frozenset((Operator.BETWEEN, Operator.NOT_BETWEEN))
+
+# Joiners for Q connectors
+_CONNECTORS = {"AND": _SQL_AND, "OR": sys.intern(" OR ")}
+
+# SELECT templates for single-field equality lookups, keyed on (table, field)
+_POINT_LOOKUP_TEMPLATES: Dict[Tuple[str, str], str] = {}
+
+# Bulk loading limits
+_BULK_BATCH_THRESHOLD = 100
+_MAX_QUERY_PARAMS = 32767
+
+# Savepoint statements for the common nesting depths, built once
+_SAVEPOINT_DEPTH = 32
+_SAVEPOINT_SQL = tuple(sys.intern(f"SAVEPOINT sp_{i}") for i in range(_SAVEPOINT_DEPTH))
+_RELEASE_SAVEPOINT_SQL = tuple(sys.intern(f"RELEASE SAVEPOINT sp_{i}") for i in range(_SAVEPOINT_DEPTH))
+_ROLLBACK_SAVEPOINT_SQL = tuple(sys.intern(f"ROLLBACK TO SAVEPOINT sp_{i}") for i in range(_SAVEPOINT_DEPTH))
+
+
+def _savepoint_sql(statements: Tuple[str, ...], verb: str, depth: int) -> str:
+    """Return the savepoint statement for a nesting depth."""
+    if depth < _SAVEPOINT_DEPTH:
+        return statements[depth]
+    return f"{verb} sp_{depth}"
+
+
 @dataclass
 class QueryCondition:
     """Enhanced query condition with support for complex operations."""
@@ -94,37 +139,42 @@ class QueryCondition:
         Returns:
             Tuple of (sql_fragment, parameters)
         """
+        parameters: List[Any] = []
+        return self._render(param_style, parameters), parameters
+    
+    def _render(self, param_style: str, parameters: List[Any]) -> str:
+        """Render condition to SQL, appending its parameters to ``parameters``."""
         field_sql = self._escape_field_name(self.field)
-        parameters = []
+        operator = self.operator
         
-        if self.operator in (Operator.IS_NULL, Operator.IS_NOT_NULL):
-            sql = f"{field_sql} {self.operator.value}"
+        if operator in _NULL_OPERATORS:
+            sql = f"{field_sql} {operator.value}"
         
-        elif self.operator in (Operator.IN, Operator.NOT_IN):
-            placeholders = ", ".join([param_style for _ in self.value])
-            sql = f"{field_sql} {self.operator.value} ({placeholders})"
+        elif operator in _IN_OPERATORS:
+            placeholders = _SQL_COMMA.join([param_style] * len(self.value))
+            sql = f"{field_sql} {operator.value} ({placeholders})"
             parameters.extend(self.value)
         
-        elif self.operator in (Operator.BETWEEN, Operator.NOT_BETWEEN):
+        elif operator in _BETWEEN_OPERATORS:
             if not isinstance(self.value, (list, tuple)) or len(self.value) != 2:
                 raise InvalidQueryError("BETWEEN requires exactly 2 values")
-            sql = f"{field_sql} {self.operator.value} {param_style} AND {param_style}"
+            sql = f"{field_sql} {operator.value} {param_style} AND {param_style}"
             parameters.extend(self.value)
         
-        elif self.operator == Operator.LIKE and isinstance(self.value, str):
+        elif operator is Operator.LIKE and isinstance(self.value, str):
             # Auto-add wildcards if not present
             value = self.value if '%' in self.value or '_' in self.value else f"%{self.value}%"
-            sql = f"{field_sql} {self.operator.value} {param_style}"
+            sql = f"{field_sql} {operator.value} {param_style}"
             parameters.append(value)
         
         else:
-            sql = f"{field_sql} {self.operator.value} {param_style}"
+            sql = f"{field_sql} {operator.value} {param_style}"
             parameters.append(self.value)
         
         if self.negated:
             sql = f"NOT ({sql})"
         
-        return sql, parameters
+        return sql
     
     def _escape_field_name(self, field: str) -> str:
         """Escape field name to prevent SQL injection."""
@@ -158,11 +208,43 @@ class JoinClause:
         return f"{self.join_type.value} {table_ref} ON {self.on_condition}"
 
 
+class Row(dict):
+    """
+    Result row: a plain dictionary of column name to value.
+    
+    Subclassing dict keeps rows mutable and JSON-serializable, exactly like
+    the dictionaries queries returned before.
+    """
+    
+    __slots__ = ()
+
+
+class RowSet(list):
+    """
+    Query result: a list of `Row` dictionaries plus the column names.
+    
+    Built from one column-name tuple and the driver's value tuples, so the
+    column names are not re-read from every row.
+    """
+    
+    __slots__ = ("columns",)
+    
+    def __init__(self, columns: Tuple[str, ...] = (), rows: Optional[List[Tuple[Any, ...]]] = None):
+        super().__init__(Row(zip(columns, values)) for values in rows or ())
+        self.columns = columns
+    
+    def as_dicts(self) -> List[Dict[str, Any]]:
+        """Copy rows into plain dictionaries."""
+        return [dict(row) for row in self]
+
+
 class Q:
     """
     Enhanced query condition builder for complex WHERE clauses.
     """
     
+    __slots__ = ("conditions", "children", "connector", "negated")
+    
     def __init__(self, **kwargs):
         """
         Initialize Q object with field lookups.
@@ -272,37 +354,41 @@ class Q:
         Returns:
             Tuple of (sql_fragment, parameters)
         """
-        if not self.conditions and not self.children:
-            return "", []
+        parameters: List[Any] = []
+        sql = self._render(param_style, parameters)
+        return sql, parameters
+    
+    def _render(self, param_style: str, parameters: List[Any]) -> str:
+        """
+        Render this node and its children into one SQL fragment.
         
+        Parameters from the whole tree are appended to a single shared list
+        instead of being collected per node and merged on the way back up.
+        """
         sql_parts = []
-        all_parameters = []
         
         # Process direct conditions
         for condition in self.conditions:
-            sql_part, params = condition.to_sql(param_style)
-            sql_parts.append(sql_part)
-            all_parameters.extend(params)
+            sql_parts.append(condition._render(param_style, parameters))
         
         # Process child Q objects
         for child in self.children:
-            child_sql, child_params = child.to_sql(param_style)
+            child_sql = child._render(param_style, parameters)
             if child_sql:
                 if child.negated:
                     child_sql = f"NOT ({child_sql})"
                 sql_parts.append(f"({child_sql})")
-                all_parameters.extend(child_params)
         
         if not sql_parts:
-            return "", []
+            return ""
         
-        connector = f" {self.connector} "
+        connector = _CONNECTORS.get(self.connector) or f" {self.connector} "
         sql = connector.join(sql_parts)
         
         if self.negated:
             sql = f"NOT ({sql})"
         
-        return sql, all_parameters
+        return sql
 
 
 class QueryBuilder:
@@ -310,6 +396,16 @@ class QueryBuilder:
     Enhanced SQL query builder with comprehensive features.
     """
     
+    __slots__ = (
+        "table_name", "model_class",
+        "_select_fields", "_distinct", "_where_conditions", "_joins",
+        "_group_by", "_having_conditions", "_order_by",
+        "_limit_value", "_offset_value", "_raw_params", "_raw_sql",
+        "_insert_data", "_update_data", "_upsert_data", "_upsert_conflict_fields",
+        "_query_type", "_subqueries", "_with_clauses",
+        "_connection",
+    )
+    
     def __init__(self, table_name: str, model_class: Optional[Type] = None):
         self.table_name = table_name
         self.model_class = model_class
@@ -615,10 +711,31 @@ class QueryBuilder:
         
         return builder(param_style)
     
+    def _append_conditions(
+        self,
+        parts: List[str],
+        keyword: str,
+        conditions: List[Q],
+        parameters: List[Any],
+        param_style: str
+    ) -> None:
+        """Append a WHERE/HAVING clause built from Q objects to ``parts``."""
+        first = True
+        for q in conditions:
+            q_sql, q_params = q.to_sql(param_style)
+            if not q_sql:
+                continue
+            parts.append(keyword if first else _SQL_AND)
+            parts.append("(")
+            parts.append(q_sql)
+            parts.append(")")
+            parameters.extend(q_params)
+            first = False
+    
     def _build_select_sql(self, param_style: str = "?") -> Tuple[str, List[Any]]:
         """Build SELECT SQL query."""
-        parameters = []
-        sql_parts = []
+        parameters: List[Any] = []
+        parts: List[str] = []
         
         # WITH clauses (CTEs)
         if self._with_clauses:
@@ -627,61 +744,53 @@ class QueryBuilder:
                 cte_sql, cte_params = query.build_sql(param_style)
                 with_parts.append(f"{name} AS ({cte_sql})")
                 parameters.extend(cte_params)
-            sql_parts.append("WITH " + ", ".join(with_parts))
+            parts.append(_SQL_WITH)
+            parts.append(_SQL_COMMA.join(with_parts))
+            parts.append(" ")
         
         # SELECT clause
-        distinct = "DISTINCT " if self._distinct else ""
-        fields = ", ".join(self._select_fields)
-        sql_parts.append(f"SELECT {distinct}{fields}")
+        parts.append(_SQL_SELECT)
+        if self._distinct:
+            parts.append(_SQL_DISTINCT)
+        parts.append(_SQL_COMMA.join(self._select_fields))
         
         # FROM clause
-        sql_parts.append(f"FROM {self.table_name}")
+        parts.append(_SQL_FROM)
+        parts.append(self.table_name)
         
         # JOIN clauses
         for join in self._joins:
-            sql_parts.append(join.to_sql())
+            parts.append(" ")
+            parts.append(join.to_sql())
         
         # WHERE clause
-        if self._where_conditions:
-            where_parts = []
-            for q in self._where_conditions:
-                q_sql, q_params = q.to_sql(param_style)
-                if q_sql:
-                    where_parts.append(q_sql)
-                    parameters.extend(q_params)
-            
-            if where_parts:
-                sql_parts.append("WHERE " + " AND ".join(f"({part})" for part in where_parts))
+        self._append_conditions(parts, _SQL_WHERE, self._where_conditions, parameters, param_style)
         
         # GROUP BY clause
         if self._group_by:
-            sql_parts.append("GROUP BY " + ", ".join(self._group_by))
+            parts.append(_SQL_GROUP_BY)
+            parts.append(_SQL_COMMA.join(self._group_by))
         
         # HAVING clause
-        if self._having_conditions:
-            having_parts = []
-            for q in self._having_conditions:
-                q_sql, q_params = q.to_sql(param_style)
-                if q_sql:
-                    having_parts.append(q_sql)
-                    parameters.extend(q_params)
-            
-            if having_parts:
-                sql_parts.append("HAVING " + " AND ".join(f"({part})" for part in having_parts))
+        self._append_conditions(parts, _SQL_HAVING, self._having_conditions, parameters, param_style)
         
         # ORDER BY clause
         if self._order_by:
-            order_parts = [f"{field} {direction.value}" for field, direction in self._order_by]
-            sql_parts.append("ORDER BY " + ", ".join(order_parts))
+            parts.append(_SQL_ORDER_BY)
+            parts.append(_SQL_COMMA.join(
+                f"{field} {direction.value}" for field, direction in self._order_by
+            ))
         
         # LIMIT and OFFSET
         if self._limit_value:
-            sql_parts.append(f"LIMIT {self._limit_value}")
+            parts.append(_SQL_LIMIT)
+            parts.append(str(self._limit_value))
         
         if self._offset_value:
-            sql_parts.append(f"OFFSET {self._offset_value}")
+            parts.append(_SQL_OFFSET)
+            parts.append(str(self._offset_value))
         
-        return " ".join(sql_parts), parameters
+        return "".join(parts), parameters
     
     def _build_insert_sql(self, param_style: str = "?") -> Tuple[str, List[Any]]:
         """Build INSERT SQL query."""
@@ -739,21 +848,12 @@ class QueryBuilder:
                 set_parts.append(f'"{field}" = {param_style}')
                 parameters.append(value)
         
-        sql = f'UPDATE "{self.table_name}" SET {", ".join(set_parts)}'
+        parts = [f'UPDATE "{self.table_name}" SET ', _SQL_COMMA.join(set_parts)]
         
         # Add WHERE clause
-        if self._where_conditions:
-            where_parts = []
-            for q in self._where_conditions:
-                q_sql, q_params = q.to_sql(param_style)
-                if q_sql:
-                    where_parts.append(q_sql)
-                    parameters.extend(q_params)
-            
-            if where_parts:
-                sql += " WHERE " + " AND ".join(f"({part})" for part in where_parts)
+        self._append_conditions(parts, _SQL_WHERE, self._where_conditions, parameters, param_style)
         
-        return sql, parameters
+        return "".join(parts), parameters
     
     def _build_upsert_sql(self, param_style: str = "?") -> Tuple[str, List[Any]]:
         """Build UPSERT (INSERT ... ON CONFLICT) SQL query."""
@@ -789,25 +889,16 @@ class QueryBuilder:
     
     def _build_delete_sql(self, param_style: str = "?") -> Tuple[str, List[Any]]:
         """Build DELETE SQL query."""
-        sql = f'DELETE FROM "{self.table_name}"'
-        parameters = []
+        parts = [f'DELETE FROM "{self.table_name}"']
+        parameters: List[Any] = []
         
         # Add WHERE clause
-        if self._where_conditions:
-            where_parts = []
-            for q in self._where_conditions:
-                q_sql, q_params = q.to_sql(param_style)
-                if q_sql:
-                    where_parts.append(q_sql)
-                    parameters.extend(q_params)
-            
-            if where_parts:
-                sql += " WHERE " + " AND ".join(f"({part})" for part in where_parts)
+        self._append_conditions(parts, _SQL_WHERE, self._where_conditions, parameters, param_style)
         
-        return sql, parameters
+        return "".join(parts), parameters
     
     # Execution methods
-    async def execute(self, connection: Optional['DatabaseConnection'] = None) -> List[Dict[str, Any]]:
+    async def execute(self, connection: Optional['DatabaseConnection'] = None) -> RowSet:
         """
         Execute the query and return results.
         
@@ -815,37 +906,93 @@ class QueryBuilder:
             connection: Database connection to use
             
         Returns:
-            List of result rows as dictionaries
+            RowSet of result rows (each row is a dictionary)
         """
         conn = connection or self._connection
         if not conn:
             raise DatabaseError("No database connection available")
         
         sql, parameters = self.build_sql()
-        logger.debug(f"Executing SQL: {sql} with params: {parameters}")
+        return await self._execute_sql(conn, sql, parameters)
+    
+    async def _execute_sql(
+        self,
+        conn: 'DatabaseConnection',
+        sql: str,
+        parameters: List[Any]
+    ) -> RowSet:
+        """Run already-built SQL on a connection, wrapping driver errors."""
+        logger.debug("Executing SQL: %s with params: %s", sql, parameters)
         
         try:
             return await conn.execute_query(sql, parameters)
         except Exception as e:
-            logger.error(f"Query execution failed: {e}")
+            logger.error("Query execution failed: %s", e)
             raise DatabaseError(f"Query execution failed: {e}")
     
-    async def fetch_one(self, connection: Optional['DatabaseConnection'] = None) -> Optional[Dict[str, Any]]:
+    def _point_lookup(self) -> Optional[Tuple[str, List[Any]]]:
+        """
+        Return SQL and parameters for a plain ``field = value`` lookup, or None.
+        
+        Matches the ``where("id", value).fetch_one()`` shape and serves it from
+        a per-table template instead of running the full SQL builder.
+        """
+        if (
+            self._query_type != "SELECT"
+            or len(self._where_conditions) != 1
+            or self._select_fields != ["*"]
+            or self._distinct
+            or self._joins
+            or self._group_by
+            or self._having_conditions
+            or self._order_by
+            or self._offset_value
+            or self._with_clauses
+        ):
+            return None
+        
+        q = self._where_conditions[0]
+        if q.negated or q.children or len(q.conditions) != 1:
+            return None
+        
+        condition = q.conditions[0]
+        if condition.operator is not Operator.EQ or condition.negated:
+            return None
+        
+        key = (self.table_name, condition.field)
+        sql = _POINT_LOOKUP_TEMPLATES.get(key)
+        if sql is None:
+            field_sql = condition._escape_field_name(condition.field)
+            sql = f"SELECT * FROM {self.table_name} WHERE ({field_sql} = ?) LIMIT 1"
+            _POINT_LOOKUP_TEMPLATES[key] = sql
+        
+        return sql, [condition.value]
+    
+    async def fetch_one(self, connection: Optional['DatabaseConnection'] = None) -> Optional[Row]:
         """Execute query and return first result."""
         self.limit(1)
-        results = await self.execute(connection)
+        
+        point_lookup = self._point_lookup()
+        if point_lookup is None:
+            results = await self.execute(connection)
+        else:
+            conn = connection or self._connection
+            if not conn:
+                raise DatabaseError("No database connection available")
+            results = await self._execute_sql(conn, *point_lookup)
+        
         return results[0] if results else None
     
-    async def fetch_all(self, connection: Optional['DatabaseConnection'] = None) -> List[Dict[str, Any]]:
+    async def fetch_all(self, connection: Optional['DatabaseConnection'] = None) -> RowSet:
         """Execute query and return all results."""
         return await self.execute(connection)
     
     async def fetch_value(self, connection: Optional['DatabaseConnection'] = None) -> Any:
         """Execute query and return single value from first row."""
         result = await self.fetch_one(connection)
-        if result:
-            return next(iter(result.values()))
-        return None
+        if not result:
+            return None
+        return next(iter(result.values()))
     
     async def exists(self, connection: Optional['DatabaseConnection'] = None) -> bool:
         """Check if query returns any results."""
@@ -859,6 +1006,24 @@ class QueryBuilder:
         finally:
             self._select_fields = original_fields
     
+    async def as_prepared(self, connection: Optional['DatabaseConnection'] = None) -> 'PreparedQuery':
+        """
+        Build this query's SQL once and return a reusable `PreparedQuery`.
+        
+        Hot endpoints that run the same query shape with different values
+        can hold on to the result and skip SQL building on every call.
+        
+        Example:
+            >>> by_email = await QueryBuilder("users").where("email", "").as_prepared(conn)
+            >>> user = await by_email.fetch_one("jane@example.com")
+        """
+        conn = connection or self._connection
+        if not conn:
+            raise DatabaseError("No database connection available")
+        
+        sql, parameters = self.build_sql()
+        return PreparedQuery(conn, sql, parameters)
+    
     # Utility methods
     def explain(self, analyze: bool = False) -> 'QueryBuilder':
         """Add EXPLAIN to query for performance analysis."""
@@ -899,6 +1064,55 @@ class QueryBuilder:
         return f"<QueryBuilder table='{self.table_name}' type='{self._query_type}'>"
 
 
+class PreparedQuery:
+    """
+    A query whose SQL has been built once and can be executed repeatedly.
+    
+    Positional arguments passed to the fetch methods replace the parameters
+    the query was built with, in placeholder order, and must supply one
+    value per placeholder. Calling without arguments reuses the original
+    parameters.
+    """
+    
+    __slots__ = ("_connection", "sql", "_parameters", "param_count")
+    
+    def __init__(self, connection: 'DatabaseConnection', sql: str, parameters: List[Any]):
+        self._connection = connection
+        self.sql = sql
+        self._parameters = parameters
+        self.param_count = len(parameters)
+    
+    async def execute(self, *params: Any) -> RowSet:
+        """Execute the prepared SQL and return all rows."""
+        if not params:
+            parameters = self._parameters
+        elif len(params) != self.param_count:
+            raise ValueError(
+                f"Prepared query takes {self.param_count} parameters, got {len(params)}"
+            )
+        else:
+            parameters = list(params)
+        logger.debug("Executing prepared SQL: %s with params: %s", self.sql, parameters)
+        
+        try:
+            return await self._connection.execute_query(self.sql, parameters)
+        except Exception as e:
+            logger.error("Query execution failed: %s", e)
+            raise DatabaseError(f"Query execution failed: {e}")
+    
+    async def fetch_all(self, *params: Any) -> RowSet:
+        """Execute the prepared SQL and return all rows."""
+        return await self.execute(*params)
+    
+    async def fetch_one(self, *params: Any) -> Optional[Row]:
+        """Execute the prepared SQL and return the first row."""
+        results = await self.execute(*params)
+        return results[0] if results else None
+    
+    def __repr__(self) -> str:
+        return f"<PreparedQuery sql='{self.sql}'>"
+
+
 class DatabaseConnection:
     """
     Enhanced database connection manager with connection pooling support.
@@ -919,13 +1133,14 @@ class DatabaseConnection:
         self.pool_recycle = pool_recycle
         
         self._connection_pool = None
-        self._transaction_stack = []
+        # Savepoint depths of nested transactions, released in LIFO order
+        self._transaction_stack = array("H")
         self._in_transaction = False
     
     async def connect(self) -> None:
         """Establish database connection pool."""
         # TODO: implement actual database connection pooling
-        logger.info(f"Database connection pool established (size: {self.pool_size})")
+        logger.info("Database connection pool established (size: %s)", self.pool_size)
     
     async def disconnect(self) -> None:
         """Close all database connections."""
@@ -933,7 +1148,7 @@ class DatabaseConnection:
             # TODO: implement connection pool cleanup
             logger.info("Database connection pool closed")
     
-    async def execute_query(self, sql: str, parameters: Optional[List[Any]] = None) -> List[Dict[str, Any]]:
+    async def execute_query(self, sql: str, parameters: Optional[List[Any]] = None) -> RowSet:
         """
         Execute SQL query with parameters.
         
@@ -942,12 +1157,12 @@ class DatabaseConnection:
             parameters: Query parameters
             
         Returns:
-            Query results as list of dictionaries
+            Query results as a RowSet
         """
         if parameters is None:
             parameters = []
         
-        logger.debug(f"Executing: {sql} with params: {parameters}")
+        logger.debug("Executing: %s with params: %s", sql, parameters)
         
         # TODO: implement actual database execution
         # This would get a connection from the pool and execute the query
@@ -955,18 +1170,18 @@ class DatabaseConnection:
         # Mock implementation for demonstration
         if sql.upper().startswith('SELECT'):
             if 'COUNT(' in sql.upper():
-                return [{'count': 42}]
+                return RowSet(('count',), [(42,)])
             elif 'users' in sql.lower():
-                return [
-                    {'id': 1, 'name': 'John Doe', 'email': 'john@example.com'},
-                    {'id': 2, 'name': 'Jane Smith', 'email': 'jane@example.com'}
-                ]
+                return RowSet(('id', 'name', 'email'), [
+                    (1, 'John Doe', 'john@example.com'),
+                    (2, 'Jane Smith', 'jane@example.com'),
+                ])
         elif sql.upper().startswith(('INSERT', 'UPDATE', 'DELETE')):
-            return [{'affected_rows': 1, 'last_insert_id': 1}]
+            return RowSet(('affected_rows', 'last_insert_id'), [(1, 1)])
         
-        return []
+        return RowSet()
     
-    async def execute_transaction(self, queries: List[Tuple[str, List[Any]]]) -> List[List[Dict[str, Any]]]:
+    async def execute_transaction(self, queries: List[Tuple[str, List[Any]]]) -> List[RowSet]:
         """
         Execute multiple queries in a transaction.
         
@@ -976,7 +1191,7 @@ class DatabaseConnection:
         Returns:
             List of results for each query
         """
-        logger.debug(f"Executing transaction with {len(queries)} queries")
+        logger.debug("Executing transaction with %d queries", len(queries))
         
         results = []
         try:
@@ -991,7 +1206,7 @@ class DatabaseConnection:
             
         except Exception as e:
             await self.rollback_transaction()
-            logger.error(f"Transaction rolled back due to error: {e}")
+            logger.error("Transaction rolled back due to error: %s", e)
             raise
         
         return results
@@ -1000,9 +1215,9 @@ class DatabaseConnection:
         """Begin a new transaction."""
         if self._in_transaction:
             # Nested transaction - use savepoint
-            savepoint_name = f"sp_{len(self._transaction_stack)}"
-            await self.execute_query(f"SAVEPOINT {savepoint_name}")
-            self._transaction_stack.append(savepoint_name)
+            depth = len(self._transaction_stack)
+            await self.execute_query(_savepoint_sql(_SAVEPOINT_SQL, "SAVEPOINT", depth))
+            self._transaction_stack.append(depth)
         else:
             await self.execute_query("BEGIN")
             self._in_transaction = True
@@ -1011,8 +1226,10 @@ class DatabaseConnection:
         """Commit the current transaction."""
         if self._transaction_stack:
             # Release savepoint
-            savepoint = self._transaction_stack.pop()
-            await self.execute_query(f"RELEASE SAVEPOINT {savepoint}")
+            depth = self._transaction_stack.pop()
+            await self.execute_query(
+                _savepoint_sql(_RELEASE_SAVEPOINT_SQL, "RELEASE SAVEPOINT", depth)
+            )
         else:
             await self.execute_query("COMMIT")
             self._in_transaction = False
@@ -1021,8 +1238,10 @@ class DatabaseConnection:
         """Rollback the current transaction."""
         if self._transaction_stack:
             # Rollback to savepoint
-            savepoint = self._transaction_stack.pop()
-            await self.execute_query(f"ROLLBACK TO SAVEPOINT {savepoint}")
+            depth = self._transaction_stack.pop()
+            await self.execute_query(
+                _savepoint_sql(_ROLLBACK_SAVEPOINT_SQL, "ROLLBACK TO SAVEPOINT", depth)
+            )
         else:
             await self.execute_query("ROLLBACK")
             self._in_transaction = False
@@ -1039,18 +1258,64 @@ class DatabaseConnection:
     
     async def create_table(self, table_name: str, columns: Dict[str, str]) -> None:
         """Create a table with specified columns."""
+        await self.execute_query(self._create_table_sql(table_name, columns))
+    
+    async def drop_table(self, table_name: str, if_exists: bool = False) -> None:
+        """Drop a table."""
+        await self.execute_query(self._drop_table_sql(table_name, if_exists))
+    
+    def _create_table_sql(self, table_name: str, columns: Dict[str, str]) -> str:
+        """Build CREATE TABLE SQL."""
         column_defs = []
         for name, definition in columns.items():
             column_defs.append(f'"{name}" {definition}')
         
-        sql = f'CREATE TABLE "{table_name}" ({", ".join(column_defs)})'
-        await self.execute_query(sql)
+        return f'CREATE TABLE "{table_name}" ({", ".join(column_defs)})'
     
-    async def drop_table(self, table_name: str, if_exists: bool = False) -> None:
-        """Drop a table."""
+    def _drop_table_sql(self, table_name: str, if_exists: bool = False) -> str:
+        """Build DROP TABLE SQL."""
         if_exists_clause = "IF EXISTS " if if_exists else ""
-        sql = f'DROP TABLE {if_exists_clause}"{table_name}"'
-        await self.execute_query(sql)
+        return f'DROP TABLE {if_exists_clause}"{table_name}"'
+    
+    async def insert_records_batched(
+        self,
+        table_name: str,
+        columns: List[str],
+        records: List[Tuple[Any, ...]]
+    ) -> int:
+        """
+        Load many rows into a table in one transaction with batched INSERTs.
+        
+        Records are positional tuples matching ``columns``. Rows are sent as
+        multi-row ``INSERT ... VALUES`` statements (not ``COPY``) sized to stay
+        under the driver's bind-parameter limit; the SQL text for a full batch
+        is built once and reused.
+        
+        Returns:
+            Number of records written
+        """
+        if not records:
+            return 0
+        
+        field_names = ", ".join(f'"{column}"' for column in columns)
+        row_placeholders = "(" + ", ".join(["?"] * len(columns)) + ")"
+        batch_size = max(1, _MAX_QUERY_PARAMS // len(columns))
+        
+        def batch_sql(row_count: int) -> str:
+            values = ", ".join([row_placeholders] * row_count)
+            return f'INSERT INTO "{table_name}" ({field_names}) VALUES {values}'
+        
+        full_batch_rows = min(batch_size, len(records))
+        full_batch_sql = batch_sql(full_batch_rows)
+        
+        async with Transaction(self):
+            for start in range(0, len(records), batch_size):
+                batch = records[start:start + batch_size]
+                sql = full_batch_sql if len(batch) == full_batch_rows else batch_sql(len(batch))
+                parameters = [value for record in batch for value in record]
+                await self.execute_query(sql, parameters)
+        
+        return len(records)
 
 
 # Transaction context manager
@@ -1072,19 +1337,39 @@ class Transaction:
 
 
 # Query execution helpers
-async def execute_raw_query(connection: DatabaseConnection, sql: str, parameters: Optional[List[Any]] = None) -> List[Dict[str, Any]]:
+async def execute_raw_query(connection: DatabaseConnection, sql: str, parameters: Optional[List[Any]] = None) -> RowSet:
     """Execute raw SQL query."""
     return await connection.execute_query(sql, parameters or [])
 
 
 async def bulk_insert(connection: DatabaseConnection, table: str, data: List[Dict[str, Any]]) -> int:
-    """Perform bulk insert operation."""
+    """
+    Perform bulk insert operation.
+    
+    Every row must have the same keys as the first one; a row with missing
+    or extra keys raises ValueError instead of failing mid-insert or having
+    its extra keys silently dropped.
+    """
     if not data:
         return 0
     
-    query = QueryBuilder(table).insert_many(data)
-    result = await query.execute(connection)
-    return len(data)  # In real implementation, return actual affected rows
+    # Every row must fill the same columns as the first one
+    columns = list(data[0].keys())
+    expected = set(columns)
+    for index, row in enumerate(data):
+        if row.keys() != expected:
+            raise ValueError(
+                f"bulk_insert row {index} has columns {sorted(row)}, expected {sorted(expected)}"
+            )
+    
+    if len(data) < _BULK_BATCH_THRESHOLD:
+        query = QueryBuilder(table).insert_many(data)
+        result = await query.execute(connection)
+        return len(data)  # In real implementation, return actual affected rows
+    
+    # Large loads skip the query builder and go through the connection's bulk path
+    records = [tuple(row[column] for column in columns) for row in data]
+    return await connection.insert_records_batched(table, columns, records)
 
 
 async def bulk_update(connection: DatabaseConnection, table: str, updates: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> int:
@@ -1145,24 +1430,44 @@ class Migration:
         return self
     
     async def execute(self) -> None:
-        """Execute all migration operations."""
-        async with Transaction(self.connection):
+        """
+        Execute all migration operations.
+        
+        Consecutive statements without parameters are joined and sent in a
+        single round trip; parameterized statements are sent on their own,
+        keeping the original operation order.
+        """
+        connection = self.connection
+        batch: List[str] = []
+        
+        async def flush() -> None:
+            if batch:
+                await connection.execute_query(";\n".join(batch))
+                batch.clear()
+        
+        async with Transaction(connection):
             for operation in self.operations:
                 op_type = operation[0]
                 
                 if op_type == 'create_table':
-                    await self.connection.create_table(operation[1], operation[2])
+                    batch.append(connection._create_table_sql(operation[1], operation[2]))
                 elif op_type == 'drop_table':
-                    await self.connection.drop_table(operation[1], operation[2])
+                    batch.append(connection._drop_table_sql(operation[1], operation[2]))
                 elif op_type == 'raw_sql':
-                    await self.connection.execute_query(operation[1], operation[2])
+                    if operation[2]:
+                        await flush()
+                        await connection.execute_query(operation[1], operation[2])
+                    else:
+                        batch.append(operation[1])
+            
+            await flush()
 
 
 # Export commonly used classes and functions
 __all__ = [
     # Core classes
-    'QueryBuilder', 'Q', 'QueryCondition', 'JoinClause',
-    'DatabaseConnection', 'Transaction', 'Migration',
+    'QueryBuilder', 'Q', 'QueryCondition', 'JoinClause', 'Row', 'RowSet',
+    'DatabaseConnection', 'PreparedQuery', 'Transaction', 'Migration',
     
     # Enums
     'Operator', 'SortOrder', 'JoinType',
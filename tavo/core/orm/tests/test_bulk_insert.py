@@ -0,0 +1,88 @@
+"""
+Tests for bulk_insert and DatabaseConnection.insert_records_batched
+"""
+
+import asyncio
+
+import pytest
+
+from tavo.core.orm import query
+from tavo.core.orm.query import DatabaseConnection, RowSet, bulk_insert
+
+
+class RecordingConnection(DatabaseConnection):
+    """Mock connection that records the SQL and parameters it runs"""
+
+    def __init__(self):
+        super().__init__("sqlite://")
+        self.calls = []
+
+    async def execute_query(self, sql, parameters=None):
+        self.calls.append((sql, parameters))
+        return RowSet()
+
+    @property
+    def inserts(self):
+        return [(sql, params) for sql, params in self.calls if sql.startswith("INSERT")]
+
+
+def rows(count: int):
+    return [{"id": i, "name": f"user{i}"} for i in range(count)]
+
+
+class TestBulkInsert:
+
+    def setup_method(self):
+        """Create a fresh connection for each test"""
+        self.conn = RecordingConnection()
+
+    def test_empty(self):
+        """Nothing is written for no rows"""
+        assert asyncio.run(bulk_insert(self.conn, "users", [])) == 0
+        assert self.conn.calls == []
+
+    @pytest.mark.parametrize("count", [3, query._BULK_BATCH_THRESHOLD])
+    def test_writes_all_rows(self, count):
+        """Small and large loads write every row in column order"""
+        assert asyncio.run(bulk_insert(self.conn, "users", rows(count))) == count
+        params = [value for _, batch in self.conn.inserts for value in batch]
+        assert params == [value for row in rows(count) for value in (row["id"], row["name"])]
+
+    def test_large_load_is_batched(self, monkeypatch):
+        """Large loads are split into INSERTs under the parameter limit"""
+        monkeypatch.setattr(query, "_MAX_QUERY_PARAMS", 50)
+        count = query._BULK_BATCH_THRESHOLD + 30
+
+        asyncio.run(bulk_insert(self.conn, "users", rows(count)))
+
+        # 50 parameters / 2 columns = 25 rows per INSERT
+        assert [len(params) // 2 for _, params in self.conn.inserts] == [25] * 5 + [5]
+        assert self.conn.inserts[0][0].count("(?, ?)") == 25
+        assert self.conn.calls[0][0] == "BEGIN"
+        assert self.conn.calls[-1][0] == "COMMIT"
+
+    @pytest.mark.parametrize("count", [3, query._BULK_BATCH_THRESHOLD])
+    def test_missing_key_rejected(self, count):
+        """A row missing a column raises ValueError before anything is written"""
+        data = rows(count)
+        del data[1]["name"]
+
+        with pytest.raises(ValueError, match="row 1 has columns"):
+            asyncio.run(bulk_insert(self.conn, "users", data))
+        assert self.conn.calls == []
+
+    @pytest.mark.parametrize("count", [3, query._BULK_BATCH_THRESHOLD])
+    def test_extra_key_rejected(self, count):
+        """A row with an extra column raises instead of dropping the value"""
+        data = rows(count)
+        data[-1]["email"] = "x@example.com"
+
+        with pytest.raises(ValueError, match=f"row {count - 1} has columns"):
+            asyncio.run(bulk_insert(self.conn, "users", data))
+        assert self.conn.calls == []
+
+    def test_key_order_does_not_matter(self):
+        """Rows with the same keys in another order are accepted"""
+        data = [{"id": 1, "name": "a"}, {"name": "b", "id": 2}]
+        asyncio.run(bulk_insert(self.conn, "users", data))
+        assert self.conn.inserts[0][1] == [1, "a", 2, "b"]
@@ -0,0 +1,75 @@
+"""
+Tests for JSONField serialization
+"""
+
+import json
+import math
+import uuid
+from datetime import datetime
+
+import pytest
+
+from tavo.core.orm import fields
+from tavo.core.orm.fields import JSONField
+
+
+VALUES = [
+    {"a": 1},
+    {"s": "é", "nested": {"list": [1, 2.5, True]}},
+    {"name": "nullable", "value": None},
+    [None, "null", {"k": None}],
+    {1: "int key"},
+    2 ** 70,
+    "plain string",
+]
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def orjson_available(request, monkeypatch):
+    """Run each test with and without orjson"""
+    if request.param and not fields.ORJSON_AVAILABLE:
+        pytest.skip("orjson is not installed")
+    monkeypatch.setattr(fields, "ORJSON_AVAILABLE", request.param)
+    return request.param
+
+
+class TestJSONFieldRoundTrip:
+
+    def setup_method(self):
+        """Create a fresh field for each test"""
+        self.field = JSONField()
+
+    @pytest.mark.parametrize("value", VALUES)
+    def test_stored_text_is_stdlib_json(self, orjson_available, value):
+        """Stored text has one format whether or not orjson is installed"""
+        assert self.field.to_db_value(value) == json.dumps(value)
+
+    @pytest.mark.parametrize("value", VALUES)
+    def test_round_trip(self, orjson_available, value):
+        """Values read back equal what the stdlib decoder produces"""
+        stored = self.field.to_db_value(value)
+        assert self.field.from_db_value(stored) == json.loads(stored)
+
+    @pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+    def test_non_finite_floats(self, orjson_available, value):
+        """NaN and Infinity are stored as the stdlib writes them and read back"""
+        stored = self.field.to_db_value([value])
+        assert stored == json.dumps([value])
+        restored = self.field.from_db_value(stored)[0]
+        assert restored == value or (math.isnan(value) and math.isnan(restored))
+
+    @pytest.mark.parametrize("value", [datetime(2024, 1, 1), uuid.UUID(int=1), {"when": datetime(2024, 1, 1)}])
+    def test_rejects_non_json_types(self, orjson_available, value):
+        """Values the stdlib cannot encode are invalid either way"""
+        with pytest.raises(ValueError):
+            self.field._validate_type(value)
+
+    def test_none(self, orjson_available):
+        """None and empty values are stored and read as NULL"""
+        assert self.field.to_db_value(None) is None
+        assert self.field.from_db_value(None) is None
+        assert self.field.from_db_value("") is None
+
+    def test_invalid_text_returned_as_is(self, orjson_available):
+        """Text that is not JSON is returned unchanged"""
+        assert self.field.from_db_value("not json") == "not json"
@@ -0,0 +1,78 @@
+"""
+Tests for QueryBuilder.as_prepared and PreparedQuery
+"""
+
+import asyncio
+
+import pytest
+
+from tavo.core.orm.query import DatabaseConnection, PreparedQuery, QueryBuilder, RowSet
+
+
+class RecordingConnection(DatabaseConnection):
+    """Mock connection that records the SQL and parameters it runs"""
+
+    def __init__(self):
+        super().__init__("sqlite://")
+        self.calls = []
+
+    async def execute_query(self, sql, parameters=None):
+        self.calls.append((sql, parameters))
+        return RowSet(("id",), [(1,)])
+
+
+def prepare(query: QueryBuilder, conn: DatabaseConnection) -> PreparedQuery:
+    return asyncio.run(query.as_prepared(conn))
+
+
+class TestPreparedQuery:
+
+    def setup_method(self):
+        """Prepare a one-placeholder query for each test"""
+        self.conn = RecordingConnection()
+        self.prepared = prepare(QueryBuilder("users").where("email", ""), self.conn)
+
+    def test_param_count(self):
+        """The placeholder count is taken from the built query"""
+        assert self.prepared.param_count == 1
+        two = prepare(QueryBuilder("users").where("a", 1).where("b", 2), self.conn)
+        assert two.param_count == 2
+
+    def test_sql_built_once(self):
+        """Every execution reuses the SQL built at prepare time"""
+        asyncio.run(self.prepared.fetch_one("a@example.com"))
+        asyncio.run(self.prepared.fetch_all("b@example.com"))
+        assert [sql for sql, _ in self.conn.calls] == [self.prepared.sql] * 2
+
+    def test_params_replace_original(self):
+        """Positional arguments replace the original parameters"""
+        row = asyncio.run(self.prepared.fetch_one("jane@example.com"))
+        assert row == {"id": 1}
+        assert self.conn.calls[-1][1] == ["jane@example.com"]
+
+    def test_no_params_reuses_original(self):
+        """Calling without arguments reuses the build-time parameters"""
+        asyncio.run(self.prepared.fetch_all())
+        assert self.conn.calls[-1][1] == [""]
+
+    @pytest.mark.parametrize("params", [("a", "b"), ("a", "b", "c")])
+    def test_too_many_params(self, params):
+        """Extra parameters are rejected before the query runs"""
+        with pytest.raises(ValueError, match="takes 1 parameters, got"):
+            asyncio.run(self.prepared.fetch_one(*params))
+        assert self.conn.calls == []
+
+    def test_too_few_params(self):
+        """Missing parameters are rejected before the query runs"""
+        two = prepare(QueryBuilder("users").where("a", 1).where("b", 2), self.conn)
+        with pytest.raises(ValueError, match="takes 2 parameters, got 1"):
+            asyncio.run(two.fetch_all("x"))
+        assert self.conn.calls == []
+
+    def test_no_placeholders(self):
+        """A query without placeholders takes no parameters"""
+        prepared = prepare(QueryBuilder("users"), self.conn)
+        assert prepared.param_count == 0
+        assert asyncio.run(prepared.fetch_all()) == [{"id": 1}]
+        with pytest.raises(ValueError):
+            asyncio.run(prepared.fetch_all("unexpected"))
@@ -0,0 +1,151 @@
+"""
+Tests for the Row and RowSet query result types
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from tavo.core.orm.query import DatabaseConnection, QueryBuilder, Row, RowSet
+from tavo.core.responses import ORJSONResponse
+
+
+COLUMNS = ("id", "name", "email")
+VALUES = [
+    (1, "Ada", "ada@example.com"),
+    (2, "Grace", None),
+    (3, "Linus", "linus@example.com"),
+]
+# What queries returned before results became a RowSet
+OLD_RESULTS = [dict(zip(COLUMNS, values)) for values in VALUES]
+
+
+def fetch(method: str):
+    """Run a users query against the mock connection"""
+    query = QueryBuilder("users")
+    return asyncio.run(getattr(query, method)(DatabaseConnection("sqlite://")))
+
+
+class TestRow:
+
+    def setup_method(self):
+        """Build a fresh result set for each test"""
+        self.rows = RowSet(COLUMNS, list(VALUES))
+        self.row = self.rows[0]
+
+    def test_is_dict(self):
+        """Rows are plain dictionaries"""
+        assert isinstance(self.row, dict)
+        assert isinstance(self.row, Row)
+
+    def test_item_access(self):
+        """Test lookup by column name"""
+        assert self.row["id"] == 1
+        assert self.row["name"] == "Ada"
+        with pytest.raises(KeyError):
+            self.row["missing"]
+
+    def test_mapping_helpers(self):
+        """Test get, membership, keys, values and items"""
+        assert self.row.get("email") == "ada@example.com"
+        assert self.row.get("missing", "default") == "default"
+        assert "name" in self.row
+        assert "missing" not in self.row
+        assert list(self.row.keys()) == list(COLUMNS)
+        assert list(self.row.values()) == list(VALUES[0])
+        assert list(self.row.items()) == list(OLD_RESULTS[0].items())
+        assert len(self.row) == len(COLUMNS)
+
+    def test_mutable(self):
+        """Fetched rows can be changed like the old dictionaries"""
+        self.row["name"] = "Bob"
+        self.row["extra"] = True
+        del self.row["email"]
+        assert self.row == {"id": 1, "name": "Bob", "extra": True}
+
+    def test_equality_with_dict(self):
+        """Rows compare equal to the equivalent dictionary"""
+        assert self.row == OLD_RESULTS[0]
+        assert OLD_RESULTS[0] == self.row
+        assert self.row != OLD_RESULTS[1]
+
+
+class TestRowSet:
+
+    def setup_method(self):
+        """Build a fresh result set for each test"""
+        self.rows = RowSet(COLUMNS, list(VALUES))
+
+    def test_is_list(self):
+        """RowSets are lists that remember their columns"""
+        assert isinstance(self.rows, list)
+        assert self.rows.columns == COLUMNS
+        assert RowSet().columns == ()
+
+    def test_len(self):
+        """Test length of populated and empty results"""
+        assert len(self.rows) == 3
+        assert len(RowSet()) == 0
+        assert not RowSet()
+
+    def test_indexing(self):
+        """Test positive and negative indexing"""
+        assert self.rows[1] == OLD_RESULTS[1]
+        assert self.rows[-1] == OLD_RESULTS[-1]
+        with pytest.raises(IndexError):
+            self.rows[3]
+
+    def test_slicing(self):
+        """Slices match slicing the old list of dictionaries"""
+        assert self.rows[1:] == OLD_RESULTS[1:]
+        assert self.rows[::2] == OLD_RESULTS[::2]
+        assert self.rows[5:] == []
+        assert all(isinstance(row, Row) for row in self.rows[:2])
+
+    def test_iteration(self):
+        """Iteration yields rows in order"""
+        assert [dict(row) for row in self.rows] == OLD_RESULTS
+
+    def test_as_dicts(self):
+        """as_dicts copies rows into plain dictionaries"""
+        result = self.rows.as_dicts()
+        assert result == OLD_RESULTS
+        assert all(type(row) is dict for row in result)
+
+        # The dictionaries are copies, not the result's own rows
+        result[0]["name"] = "Changed"
+        assert self.rows[0]["name"] == "Ada"
+
+    def test_equality_with_old_results(self):
+        """A RowSet compares equal to the old list-of-dicts result"""
+        assert self.rows == OLD_RESULTS
+        assert OLD_RESULTS == self.rows
+        assert self.rows == RowSet(COLUMNS, list(VALUES))
+        assert RowSet() == []
+
+    def test_inequality(self):
+        """Different rows or lengths are not equal"""
+        assert self.rows != OLD_RESULTS[:2]
+        assert self.rows != list(reversed(OLD_RESULTS))
+
+
+class TestFetchedResultSerialization:
+
+    def test_fetch_types(self):
+        """fetch_one returns a Row and fetch_all a RowSet"""
+        assert isinstance(fetch("fetch_one"), Row)
+        assert isinstance(fetch("fetch_all"), RowSet)
+
+    @pytest.mark.parametrize("method", ["fetch_one", "fetch_all"])
+    def test_json_dumps(self, method):
+        """Fetched results encode with the stdlib json module"""
+        result = fetch(method)
+        assert json.loads(json.dumps(result)) == result
+
+    @pytest.mark.parametrize("method", ["fetch_one", "fetch_all"])
+    def test_orjson_response(self, method):
+        """Fetched results can be returned from an API handler"""
+        result = fetch(method)
+        response = ORJSONResponse({"data": result})
+        assert json.loads(response.body) == {"data": result}
@@ -0,0 +1,35 @@
+"""
+Tavo Responses
+
+JSON response class used by Tavo's own endpoints and API route wrappers.
+"""
+
+from typing import Any
+
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSONResponse that encodes with orjson when installed.
+
+    orjson produces UTF-8 bytes directly, so there is no intermediate str to
+    re-encode. Output matches JSONResponse (compact, non-ASCII kept); orjson
+    additionally accepts non-str dict keys. Content orjson rejects, and every
+    response when orjson is missing, goes through plain JSONResponse.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                # e.g. ints wider than 64 bits, which the stdlib still encodes
+                pass
+        return super().render(content)
@@ -11,9 +11,11 @@ from pathlib import Path
 from typing import Dict, Any, Callable, Optional, List
 from starlette.routing import Route, Router
 from starlette.requests import Request
-from starlette.responses import Response, JSONResponse
+from starlette.responses import Response
 import asyncio
 
+from ..responses import ORJSONResponse
+
 logger = logging.getLogger(__name__)
 
 
@@ -200,7 +202,7 @@ class APIRouter:
             handler = handlers.get(method)
             
             if not handler:
-                return JSONResponse(
+                return ORJSONResponse(
                     {"error": f"Method {method} not allowed"},
                     status_code=405
                 )
@@ -216,13 +218,13 @@ class APIRouter:
                 if isinstance(result, Response):
                     return result
                 elif isinstance(result, dict):
-                    return JSONResponse(result)
+                    return ORJSONResponse(result)
                 else:
-                    return JSONResponse({"data": result})
+                    return ORJSONResponse({"data": result})
                 
             except Exception as e:
                 logger.error(f"Route handler error: {e}")
-                return JSONResponse(
+                return ORJSONResponse(
                     {"error": "Internal server error"},
                     status_code=500
                 )
@@ -5,6 +5,7 @@ SSR route handler for /app — receives request path and delegates to SSR render
 """
 
 import logging
+import os
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from starlette.requests import Request
@@ -27,6 +28,8 @@ class AppRouter:
         self.build_dir = build_dir or Path("dist")
         self.ssr_renderer = SSRRenderer(self.build_dir)
         self._router: Optional[Router] = None
+        # Read once; the environment is set before the app is created
+        self._development = os.getenv("TAVO_ENV", "development") == "development"
     
     def create_router(self) -> Router:
         """
@@ -134,8 +137,7 @@ class AppRouter:
     
     def _is_development(self) -> bool:
         """Check if running in development mode."""
-        import os
-        return os.getenv("TAVO_ENV", "development") == "development"
+        return self._development
     
     def _create_error_page(self, route: str, error_message: str) -> str:
         """
@@ -6,19 +6,122 @@ Discovers routes from api/ and app/ directories and maps them to handlers.
 """
 
 import asyncio  # Move this to the top
+import concurrent.futures
+import functools
+import importlib
 import logging
+import os
 import re
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Callable
-from starlette.routing import Route, Router, Match
+from typing import Awaitable, Dict, Iterator, List, Optional, Any, Callable, Tuple
+from starlette.routing import Route, Router, Match, get_route_path
 from starlette.requests import Request
-from starlette.responses import Response, JSONResponse
+from starlette.types import Receive, Scope, Send
+from starlette.responses import PlainTextResponse, Response
 from importlib import import_module
+from types import ModuleType
+from .responses import ORJSONResponse
 from .ssr import SSRRenderer
 import sys
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Patterns applied to every discovered route file
+_SLASH_RE = re.compile(r'/+')
+_DYNAMIC_SEG_RE = re.compile(r'\[([^\]]+)\]')
+
+# Discovery runs in executor threads; serialize sys.path mutation
+_sys_path_lock = threading.Lock()
+
+# Upper bound on threads used to import route modules in parallel
+_IMPORT_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Reserved keys in route trie nodes (static children are keyed by segment text)
+_TRIE_PARAM = object()
+_TRIE_LEAF = object()
+
+def _error_response(exc: Exception) -> ORJSONResponse:
+    """500 response returned when a route handler raises."""
+    return ORJSONResponse(
+        {"error": "Internal server error", "detail": str(exc)},
+        status_code=500
+    )
+
+
+def _make_wrapped_handler(handler_fn: Callable, is_coro: bool) -> Callable:
+    """Wrap a module-level `handler` so sync and async handlers share one endpoint shape."""
+    if is_coro:
+        async def wrapped_handler(request: Request):
+            try:
+                return await handler_fn(request)
+            except Exception as e:
+                logger.error("Error in handler for %s: %s", request.url.path, e)
+                return _error_response(e)
+    else:
+        async def wrapped_handler(request: Request):
+            try:
+                return handler_fn(request)
+            except Exception as e:
+                logger.error("Error in handler for %s: %s", request.url.path, e)
+                return _error_response(e)
+    return wrapped_handler
+
+
+class _StaticRoute(Route):
+    """
+    Route without path parameters; matched by string equality, not regex.
+    """
+
+    def matches(self, scope: Scope) -> Tuple[Match, Scope]:
+        if scope["type"] != "http":
+            return super().matches(scope)
+        if get_route_path(scope) != self.path:
+            return Match.NONE, {}
+
+        child_scope = {"endpoint": self.endpoint, "path_params": dict(scope.get("path_params", {}))}
+        if self.methods and scope["method"] not in self.methods:
+            return Match.PARTIAL, child_scope
+        return Match.FULL, child_scope
+
+
+def _route_for(path: str, endpoint: Callable, **kwargs: Any) -> Route:
+    """Build a Route, using the equality-matched variant when path has no params."""
+    route_cls = Route if "{" in path else _StaticRoute
+    return route_cls(path, endpoint, **kwargs)
+
+
+class _SSRHandler:
+    """
+    ASGI endpoint rendering one SSR page route.
+
+    One small instance per page instead of a closure; the path is plain state.
+    """
+
+    __slots__ = ("renderer", "path")
+
+    def __init__(self, renderer: SSRRenderer, path: str):
+        self.renderer = renderer
+        self.path = path
+
+    async def __call__(self, scope, receive, send) -> None:
+        response = await self.render(Request(scope, receive))
+        await response(scope, receive, send)
+
+    async def render(self, request: Request) -> Response:
+        """Render the page for the given request."""
+        try:
+            html_content = await self.renderer.render_route(self.path, _ssr_context(request))
+            return Response(content=html_content, media_type="text/html")
+        except Exception as e:
+            logger.error("SSR error for %s: %s", self.path, e)
+            return ORJSONResponse(
+                {"error": f"Failed to render {self.path}", "detail": str(e)},
+                status_code=500,
+            )
+
+
 class RouteMatch:
     """Represents a matched route with parameters."""
     def __init__(self, path: str, params: Dict[str, str]):
@@ -30,34 +133,147 @@ class MethodDispatcher:
     """Handles dispatching to appropriate HTTP method handlers."""
     
     def __init__(self, method_map: Dict[str, Callable]):
-        self.method_map = method_map
+        # Normalize keys once; Starlette already reports request.method uppercased
+        self.method_map = {m.upper(): fn for m, fn in method_map.items()}
+        self._is_coro = {m: asyncio.iscoroutinefunction(fn) for m, fn in self.method_map.items()}
+        self._allowed_methods = tuple(self.method_map)
+        self._allow_header = ", ".join(self._allowed_methods)
     
     async def dispatch(self, request: Request):
         """Dispatch request to appropriate method handler."""
-        method = request.method.upper()
+        method = request.method
         handler = self.method_map.get(method)
         
         if not handler:
             # Return 405 Method Not Allowed
-            allowed_methods = list(self.method_map.keys())
-            return JSONResponse(
-                {"error": f"Method {method} not allowed", "allowed_methods": allowed_methods},
+            return ORJSONResponse(
+                {"error": f"Method {method} not allowed", "allowed_methods": self._allowed_methods},
                 status_code=405,
-                headers={"Allow": ", ".join(allowed_methods)}
+                headers={"Allow": self._allow_header}
             )
         
         try:
             # Call the handler with request and any path parameters
-            if asyncio.iscoroutinefunction(handler):
+            if self._is_coro[method]:
                 return await handler(request)
             else:
                 return handler(request)
         except Exception as e:
-            logger.error(f"Error in {method} handler for {request.url.path}: {e}")
-            return JSONResponse(
-                {"error": "Internal server error", "detail": str(e)},
-                status_code=500
-            )
+            logger.error("Error in %s handler for %s: %s", method, request.url.path, e)
+            return _error_response(e)
+
+
+def _walk_suffix(root: Path, suffix: str) -> Iterator[Tuple[str, str]]:
+    """
+    Yield ``(path, relative_path)`` strings for files under root ending in suffix.
+
+    Uses os.scandir directly so no Path objects are built per entry.
+    """
+    root_str = str(root)
+    strip = len(root_str) + 1
+    pending = deque([root_str])
+    while pending:
+        directory = pending.popleft()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        pending.append(entry.path)
+                    elif entry.name.endswith(suffix):
+                        yield entry.path, entry.path[strip:]
+        except OSError as e:
+            logger.debug("Skipping unreadable directory %s: %s", directory, e)
+
+
+def _ssr_context(request: Request) -> Dict[str, Any]:
+    """
+    Build the JSON-serializable SSR context for a request.
+
+    Equivalent to dict(request.headers) / dict(request.query_params) but in a
+    single pass: dict() over Headers looks each key up again in the raw list.
+    """
+    headers: Dict[str, str] = {}
+    for key, value in request.headers.items():
+        headers.setdefault(key, value)
+
+    return {
+        "url": str(request.url),
+        "method": request.method,
+        "headers": headers,
+        "query_params": dict(request.query_params.items()) if request.scope.get("query_string") else {},
+        "route_params": request.path_params,
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _module_path_for(py_file: str, routes_dir: str) -> str:
+    """Dotted import path (api.routes.<...>) for a route file; pure string transform."""
+    routes = Path(routes_dir)
+    relative_path = Path(py_file).relative_to(routes).with_suffix("")
+    return ".".join((routes.parent.name, routes.name) + relative_path.parts)
+
+
+def _trie_lookup(node: Dict[Any, Any], segments: List[str], index: int,
+                 params: Dict[str, str]) -> Optional[Route]:
+    """
+    Walk the route trie, preferring static children over parameters.
+
+    Depth-first with an explicit stack rather than recursion: no frame per
+    segment, and no recursion limit on deeply nested paths. Each entry carries
+    the parameter values bound along its branch; they are named from the
+    matched leaf only on a match.
+    """
+    stack: List[Tuple[Dict[Any, Any], int, Tuple[str, ...]]] = [(node, index, ())]
+    end = len(segments)
+
+    while stack:
+        node, index, bound = stack.pop()
+        if index == end:
+            leaf = node.get(_TRIE_LEAF)
+            if leaf is not None:
+                route, names = leaf
+                params.update(zip(names, bound))
+                return route
+            continue
+
+        segment = segments[index]
+        # Pushed first so it is tried only after the static branch is exhausted
+        child = node.get(_TRIE_PARAM)
+        if child is not None and segment:
+            stack.append((child, index + 1, bound + (segment,)))
+
+        child = node.get(segment)
+        if child is not None:
+            stack.append((child, index + 1, bound))
+
+    return None
+
+
+def _trie_segments(path: str) -> Optional[List[str]]:
+    """Path segments for the trie, or None if the route needs Starlette's regex."""
+    segments = path.split("/")[1:]
+    if any(("{" in seg and not (seg[0] == "{" and seg[-1] == "}")) or ":" in seg
+           for seg in segments):
+        return None
+    return segments
+
+
+def _route_priority(route: Route) -> Tuple[Any, ...]:
+    """
+    Sort key putting routes in the order match_route prefers them.
+
+    At each segment a static name sorts before a parameter (``/users/me``
+    before ``/users/{id}``), and routes the trie can't index (convertors,
+    partial-segment parameters) go last. Starlette dispatches in list order,
+    so a router sorted by this key resolves paths exactly as match_route does.
+    """
+    if "{" not in route.path:
+        # Matched by exact path before anything else
+        return (0, (False,) * route.path.count("/"))
+    segments = _trie_segments(route.path)
+    if segments is None:
+        return (1,)
+    return (0, tuple(segment[:1] == "{" for segment in segments))
 
 
 class FileBasedRouter:
@@ -68,7 +284,8 @@ class FileBasedRouter:
     API endpoints (Python) and SSR pages (React components).
     """
     
-    def __init__(self, root_dir: Path, prefix: str = "", renderer: Optional[SSRRenderer] = None):
+    def __init__(self, root_dir: Path, prefix: str = "", renderer: Optional[SSRRenderer] = None,
+                 legacy_match: bool = False):
         """
         Initialize the file-based router.
         
@@ -76,12 +293,21 @@ class FileBasedRouter:
             root_dir: Directory containing route definitions (api/ or app/)
             prefix: URL prefix for routes (e.g., "/api" for API routes)
             renderer: SSRRenderer instance for app routes (optional)
+            legacy_match: Match paths with a linear scan over Starlette routes
+                instead of the segment trie (kept for parity checks)
         """
         self.root_dir = Path(root_dir)
         self.prefix = prefix.rstrip("/")
         self.renderer = renderer
+        self.legacy_match = legacy_match
         self.routes: List[Route] = []
         self.logger = logger
+        self._trie: Dict[Any, Any] = {}
+        self._regex_routes: List[Route] = []
+        self._static_routes: Dict[str, Route] = {}
+        self._route_info: Optional[Tuple[Dict[str, Any], ...]] = None
+        self._module_cache: Dict[str, Tuple[float, ModuleType]] = {}
+        self._sys_path_added: set = set()
         
     async def discover_routes(self) -> None:
         """
@@ -90,64 +316,88 @@ class FileBasedRouter:
         For app routes: discovers .tsx files from app/ and uses SSR renderer
         """
         self.routes = []
+        self._route_info = None
         
         if self.renderer:  # App routes (React SSR)
             await self._discover_app_routes()
         else:  # API routes
             await self._discover_api_routes()
-            
-        self.logger.info(f"Discovered {len(self.routes)} routes in {self.root_dir}")
+        
+        # Stable, so equally specific routes keep discovery order
+        self.routes.sort(key=_route_priority)
+        self._build_trie()
+        self._route_info = self._build_route_info()
+        self.logger.info("Discovered %s routes in %s", len(self.routes), self.root_dir)
+
+    async def reload(self) -> None:
+        """Drop cached route modules and rediscover routes from scratch."""
+        self._module_cache.clear()
+        _module_path_for.cache_clear()
+        await self.discover_routes()
     
     async def _discover_api_routes(self) -> None:
+        """Discover API routes off the event loop (imports and file walks block)."""
+        loop = asyncio.get_running_loop()
+        self.routes = await loop.run_in_executor(None, self._discover_api_routes_sync)
+
+    def _discover_api_routes_sync(self) -> List[Route]:
         """
         Discover API routes from api/routes/ directory.
         Each .py file can export either:
         - a `handler` function (all methods handled internally)
         - or individual HTTP method functions (`get`, `post`, `put`, `delete`, etc.)
         """
+        routes: List[Route] = []
         routes_dir = self.root_dir / "routes"
         if not routes_dir.exists():
-            self.logger.warning(f"No routes directory found at {routes_dir}")
-            return
+            self.logger.warning("No routes directory found at %s", routes_dir)
+            return routes
 
-        for py_file in routes_dir.glob("**/*.py"):
-            if py_file.name == "__init__.py":
+        # Route modules import as api.routes.<name>, rooted at the project dir
+        self._ensure_on_sys_path(str(routes_dir.parent.parent))
+
+        entries: List[Tuple[Path, str]] = []
+        for file_path, relative_path in _walk_suffix(routes_dir, ".py"):
+            if relative_path == "__init__.py" or relative_path.endswith(os.sep + "__init__.py"):
                 continue
+            py_file = Path(file_path)
 
             # Convert filesystem path to URL path
-            relative_path = py_file.relative_to(routes_dir).with_suffix("")
-            route_path = f"/{relative_path.as_posix()}"  # Remove prefix here since it's added by Mount
+            route_path = "/" + relative_path.rsplit(".", 1)[0].replace(os.sep, "/")  # Prefix is added by Mount
             
             # Clean up double slashes
-            route_path = re.sub(r'/+', '/', route_path)
+            route_path = _SLASH_RE.sub('/', route_path)
 
             # Handle dynamic routes (e.g., [id].py -> {id})
-            route_path = re.sub(r'\[([^\]]+)\]', r'{\1}', route_path)
+            route_path = _DYNAMIC_SEG_RE.sub(r'{\1}', route_path)
+            entries.append((py_file, route_path))
+
+        if not entries:
+            return routes
 
+        # Import route modules in parallel; module-level code and .pyc reads
+        # dominate cold start. Routes are still built in discovery order below.
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(_IMPORT_WORKERS, len(entries))
+        ) as pool:
+            futures = [
+                pool.submit(self._load_route_module, py_file, routes_dir)
+                for py_file, _ in entries
+            ]
+            concurrent.futures.wait(futures)
+
+        for (py_file, route_path), future in zip(entries, futures):
             try:
-                # Import the route module
-                module_path = self._get_module_path(py_file, routes_dir)
-                module = import_module(module_path)
+                # Import the route module (reused while the file is unchanged)
+                module = future.result()
 
                 # Case 1: single `handler` function
                 handler = getattr(module, "handler", None)
                 if callable(handler):
-                    # Wrap handler to handle async
-                    async def wrapped_handler(request: Request, handler_fn=handler):
-                        try:
-                            if asyncio.iscoroutinefunction(handler_fn):
-                                return await handler_fn(request)
-                            else:
-                                return handler_fn(request)
-                        except Exception as e:
-                            logger.error(f"Error in handler for {request.url.path}: {e}")
-                            return JSONResponse(
-                                {"error": "Internal server error", "detail": str(e)},
-                                status_code=500
-                            )
-                    
-                    self.routes.append(Route(route_path, wrapped_handler))
-                    self.logger.debug(f"Registered API route (handler): {route_path}")
+                    # Wrap handler to handle async; resolve coroutine-ness once here
+                    wrapped_handler = _make_wrapped_handler(handler, asyncio.iscoroutinefunction(handler))
+                    routes.append(_route_for(route_path, wrapped_handler))
+                    self.logger.debug("Registered API route (handler): %s", route_path)
                     continue
 
                 # Case 2: per-method functions (`get`, `post`, etc.)
@@ -161,46 +411,56 @@ class FileBasedRouter:
                     dispatcher = MethodDispatcher(method_map)
                     methods = list(method_map.keys())
                     
-                    self.routes.append(Route(route_path, dispatcher.dispatch, methods=methods))
-                    self.logger.debug(f"Registered API route (methods): {route_path} -> {methods}")
+                    routes.append(_route_for(route_path, dispatcher.dispatch, methods=methods))
+                    self.logger.debug("Registered API route (methods): %s -> %s", route_path, methods)
                 else:
-                    self.logger.warning(f"No handler or method functions found in {py_file}")
+                    self.logger.warning("No handler or method functions found in %s", py_file)
 
-            except Exception as e:
-                self.logger.error(f"Failed to load route {py_file}: {e}")
-                import traceback
-                traceback.print_exc()
+            except Exception:
+                self.logger.exception("Failed to load route %s", py_file)
+
+        return routes
+
+    def _ensure_on_sys_path(self, path_str: str) -> None:
+        """Add a directory to sys.path once per router."""
+        if path_str in self._sys_path_added:
+            return
+        with _sys_path_lock:
+            if path_str not in sys.path:
+                sys.path.insert(0, path_str)
+        self._sys_path_added.add(path_str)
 
     def _get_module_path(self, py_file: Path, routes_dir: Path) -> str:
         """Get the correct module path for importing."""
-        # Get the relative path from routes directory
-        relative_path = py_file.relative_to(routes_dir).with_suffix("")
-        
-        # Get the project root (parent of api directory)
-        api_dir = routes_dir.parent  # This should be the 'api' directory
-        project_root = api_dir.parent  # This should be 'new_app'
-        
-        # Add project root to Python path if not already there
-        project_root_str = str(project_root)
-        if project_root_str not in sys.path:
-            sys.path.insert(0, project_root_str)
-        
         # Build the module path: api.routes.filename (without .py extension)
-        module_parts = []
-        module_parts.append(api_dir.name)  # 'api'
-        module_parts.append(routes_dir.name)  # 'routes'
-        module_parts.extend(relative_path.parts)  # subdirectories and filename
-        
-        return ".".join(module_parts)
+        return _module_path_for(str(py_file), str(routes_dir))
+
+    def _load_route_module(self, py_file: Path, routes_dir: Path) -> ModuleType:
+        """Import a route module, skipping the import when its mtime is unchanged."""
+        key = str(py_file)
+        mtime = py_file.stat().st_mtime
+        cached = self._module_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        module_path = self._get_module_path(py_file, routes_dir)
+        if cached is not None:
+            module = importlib.reload(cached[1])
+        else:
+            module = import_module(module_path)
+
+        self._module_cache[key] = (mtime, module)
+        return module
 
     def _import_route_module_safely(self, py_file: Path, routes_dir: Path):
         """Safely import a route module with better error handling."""
         try:
             # Method 1: Try standard import
+            self._ensure_on_sys_path(str(routes_dir.parent.parent))
             module_path = self._get_module_path(py_file, routes_dir)
             return import_module(module_path)
         except ImportError as e1:
-            self.logger.debug(f"Standard import failed for {py_file}: {e1}")
+            self.logger.debug("Standard import failed for %s: %s", py_file, e1)
             
             try:
                 # Method 2: Try direct file loading
@@ -213,60 +473,82 @@ class FileBasedRouter:
                     spec.loader.exec_module(module)
                     return module
             except Exception as e2:
-                self.logger.debug(f"Direct file loading failed for {py_file}: {e2}")
+                self.logger.debug("Direct file loading failed for %s: %s", py_file, e2)
                 
             # Re-raise the original import error
             raise e1
 
 
     async def _discover_app_routes(self) -> None:
+        """Discover SSR page routes off the event loop."""
+        loop = asyncio.get_running_loop()
+        self.routes = await loop.run_in_executor(None, self._discover_app_routes_sync)
+
+    def _discover_app_routes_sync(self) -> List[Route]:
         """
         Discover React SSR routes from app/ directory.
         Only `page.tsx` files are treated as routable pages.
         """
+        routes: List[Route] = []
         if not self.renderer:
             self.logger.error("SSRRenderer required for app routes")
-            return
+            return routes
 
-        for tsx_file in self.root_dir.glob("**/page.tsx"):
-            # Convert filesystem path to URL path
-            relative_path = tsx_file.relative_to(self.root_dir).parent
-            route_path = (
-                f"{self.prefix}/{relative_path.as_posix()}"
-                if relative_path.as_posix() != "."
-                else (self.prefix or "/")
-            )
+        for _, relative_path in _walk_suffix(self.root_dir, "page.tsx"):
+            if relative_path == "page.tsx":
+                route_path = self.prefix or "/"
+            elif relative_path.endswith(os.sep + "page.tsx"):
+                # Convert filesystem path to URL path
+                route_dir = relative_path[:-len("page.tsx") - 1].replace(os.sep, "/")
+                route_path = f"{self.prefix}/{route_dir}"
+            else:
+                continue
             
             # Clean up path
-            route_path = re.sub(r'/+', '/', route_path)
+            route_path = _SLASH_RE.sub('/', route_path)
 
             # Handle dynamic routes (e.g., [id]/page.tsx -> {id})
-            route_path = re.sub(r"\[([^\]]+)\]", r"{\1}", route_path)
-
-            # Create SSR handler for this route
-            async def create_ssr_handler(path: str):
-                async def ssr_handler(request: Request) -> Response:
-                    try:
-                        ssr_context = {
-                            "url": str(request.url),
-                            "method": request.method,
-                            "headers": dict(request.headers),
-                            "query_params": dict(request.query_params),
-                            "route_params": request.path_params,
-                        }
-                        html_content = await self.renderer.render_route(path, ssr_context) # type: ignore
-                        return Response(content=html_content, media_type="text/html")
-                    except Exception as e:
-                        self.logger.error(f"SSR error for {path}: {e}")
-                        return JSONResponse(
-                            {"error": f"Failed to render {path}", "detail": str(e)},
-                            status_code=500,
-                        )
-                return ssr_handler
-
-            handler = await create_ssr_handler(route_path)
-            self.routes.append(Route(route_path, handler))
-            self.logger.debug(f"Registered SSR route: {route_path}")
+            route_path = _DYNAMIC_SEG_RE.sub(r'{\1}', route_path)
+
+            routes.append(_route_for(route_path, _SSRHandler(self.renderer, route_path), methods=["GET"]))
+            self.logger.debug("Registered SSR route: %s", route_path)
+
+        return routes
+
+    def _build_trie(self) -> None:
+        """
+        Index discovered routes for match_route.
+
+        Parameterless routes go in an exact-path dict. Otherwise plain ``{name}``
+        segments become parameter children of a segment trie, shared by every
+        route with a parameter at that position; each leaf keeps its route's
+        own parameter names. Routes using convertors or partial-segment
+        parameters are left to Starlette.
+        """
+        self._trie = {}
+        self._regex_routes = []
+        self._static_routes = {}
+
+        for route in self.routes:
+            if "{" not in route.path:
+                self._static_routes.setdefault(route.path, route)
+                continue
+
+            segments = _trie_segments(route.path)
+            if segments is None:
+                self._regex_routes.append(route)
+                continue
+
+            node = self._trie
+            names = []
+            for segment in segments:
+                if segment[:1] == "{":
+                    names.append(segment[1:-1])
+                    node = node.setdefault(_TRIE_PARAM, {})
+                else:
+                    node = node.setdefault(segment, {})
+
+            node.setdefault(_TRIE_LEAF, (route, tuple(names)))
 
     def get_starlette_routes(self) -> Router:
         """
@@ -287,27 +569,86 @@ class FileBasedRouter:
         Returns:
             RouteMatch object with path and parameters if matched, None otherwise
         """
-        for route in self.routes:
-            match, params = route.matches({"type": "http", "path": path, "method": "GET"})
+        if self.legacy_match:
+            return self._match_route_linear(path, self.routes)
+
+        route = self._static_routes.get(path)
+        if route is not None:
+            return RouteMatch(route.path, {})
+
+        params: Dict[str, str] = {}
+        route = _trie_lookup(self._trie, path.split("/")[1:], 0, params)
+        if route is not None:
+            return RouteMatch(route.path, params)
+
+        if self._regex_routes:
+            return self._match_route_linear(path, self._regex_routes)
+        return None
+
+    @staticmethod
+    def _match_route_linear(path: str, routes: List[Route]) -> Optional[RouteMatch]:
+        """Match a path by asking each Starlette route in turn."""
+        scope = {"type": "http", "path": path, "method": "GET"}
+        for route in routes:
+            match, child_scope = route.matches(scope)
             if match == Match.FULL:
-                return RouteMatch(route.path, params) # type: ignore
+                return RouteMatch(route.path, child_scope.get("path_params", {}))
         return None
     
+    def _build_route_info(self) -> Tuple[Dict[str, Any], ...]:
+        """Snapshot route metadata; rebuilt only by discover_routes()."""
+        route_type = "ssr" if self.renderer else "api"
+        return tuple(
+            {
+                "path": route.path,
+                "methods": list(route.methods) if route.methods else ["GET"],
+                "type": route_type
+            }
+            for route in self.routes
+        )
+
     def get_route_info(self) -> List[Dict[str, Any]]:
         """
         Get information about all registered routes.
         
         Returns:
-            List of dictionaries containing route details
+            List of dictionaries containing route details. The metadata is
+            computed once per discover_routes(); callers get their own copies.
         """
-        return [
-            {
-                "path": route.path,
-                "methods": list(route.methods) if route.methods else ["GET"],
-                "type": "ssr" if self.renderer else "api"
-            }
-            for route in self.routes
-        ]
+        if self._route_info is None:
+            self._route_info = self._build_route_info()
+        return [{**info, "methods": list(info["methods"])} for info in self._route_info]
+
+def install_fallback_handler(router: Router, handler: Callable[[Request], Awaitable[Response]]) -> None:
+    """
+    Send every GET/HEAD request no route matches to handler, e.g. SSR.
+
+    The handler becomes the router's default ASGI app, so no catch-all
+    regex route is tried per request. Behaviour matches appending a
+    ``Route("/{path:path}", handler)`` last:
+
+    - GET/HEAD of an unmatched path goes to handler
+    - other methods get 405 with ``Allow: GET, HEAD``
+    - non-HTTP scopes get the router's own not-found
+
+    This sets ``router.redirect_slashes = False``. A catch-all route matches
+    every path, so slash redirects never fired behind one. ``/users/`` with
+    only ``/users`` defined goes to handler, not a 307 to ``/users``.
+    """
+    not_found = router.not_found
+
+    async def fallback_app(scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await not_found(scope, receive, send)
+            return
+        if scope["method"] not in ("GET", "HEAD"):
+            response = PlainTextResponse("Method Not Allowed", status_code=405, headers={"Allow": "GET, HEAD"})
+        else:
+            response = await handler(Request(scope, receive))
+        await response(scope, receive, send)
+
+    router.default = fallback_app
+    router.redirect_slashes = False
 
 
 if __name__ == "__main__":
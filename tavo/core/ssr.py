@@ -1,9 +1,74 @@
 import asyncio
+import atexit
+import functools
+import hashlib
+import json
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import subprocess # Added for npm install in example
 
 from tavo.core.bundler import get_bundler, Bundler # Import Bundler class
+from tavo.core.bundler.constants import DEFAULT_SSR_WORKERS
+from tavo.core.bundler.utils import _json_default
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Context keys that vary per request without changing the rendered page
+_VOLATILE_CONTEXT_KEYS = frozenset({"request_id", "timestamp", "timing"})
+
+
+# One reusable event loop per thread for the synchronous render helpers
+_thread_local = threading.local()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return this thread's render loop, creating it on first use."""
+    loop = getattr(_thread_local, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _thread_local.loop = loop
+        atexit.register(loop.close)
+    return loop
+
+
+def _context_digest(context: Dict[str, Any]) -> str:
+    """
+    Stable fixed-size digest of a context, independent of key order.
+
+    Mappings such as Starlette Headers are encoded by content, so callers can
+    pass them without copying them into dicts first.
+    """
+    data = None
+    if ORJSON_AVAILABLE:
+        try:
+            data = orjson.dumps(
+                context, default=_json_default,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            pass
+    if data is None:
+        # Compact separators: the output is only hashed, never read
+        data = json.dumps(context, sort_keys=True, default=_json_default, separators=(",", ":")).encode("utf-8")
+
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh64_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
 
 class SSRError(Exception):
     """Exception raised when SSR rendering fails."""
@@ -16,15 +81,54 @@ class SSRRenderer:
     to build and compile React components for hydration and SSR.
     """
 
-    def __init__(self, project_root: Optional[Path] = None):
+    def __init__(
+        self,
+        project_root: Optional[Path] = None,
+        cache_ttl: float = 0.0,
+        cache_size: int = 128,
+        max_concurrent_renders: int = DEFAULT_SSR_WORKERS,
+        coalesce_renders: bool = False
+    ):
         """
         Initialize SSR renderer.
 
         Args:
             project_root: Path to the project root directory. Defaults to current working directory.
+            cache_ttl: Seconds a rendered page is reused for an identical route and context;
+                0 (the default) disables it. Opt in for production and call
+                render_cache_clear() after a rebuild
+            cache_size: Maximum number of rendered pages kept
+            max_concurrent_renders: Renders allowed in flight at once; matches the SSR worker pool
+            coalesce_renders: Share one render between concurrent requests for the same
+                route and context. Only pays off when contexts repeat, i.e. without
+                per-request headers in them
         """
         self.project_root = Path(project_root).resolve() if project_root else Path.cwd().resolve()
         self.bundler: Bundler = get_bundler(project_root=self.project_root)
+        self._cache_ttl = cache_ttl
+        self._cache_size = cache_size
+        self._render_cache: "OrderedDict[Tuple[str, str], Tuple[float, str]]" = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._max_concurrent_renders = max(1, max_concurrent_renders)
+        self._coalesce_renders = coalesce_renders
+        self._inflight: Dict[Tuple[str, str], "asyncio.Task[str]"] = {}
+        # Semaphores are bound to a loop; render_route_sync runs on per-thread loops
+        self._render_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @staticmethod
+    def _cache_key(route: str, context: Optional[Dict[str, Any]]) -> Tuple[str, str]:
+        """Key a render on the route and the context fields that affect output."""
+        if not context:
+            return route, ""
+        # Only copy when there is something to drop; encode the tree once
+        if _VOLATILE_CONTEXT_KEYS.isdisjoint(context):
+            canonical = context
+        else:
+            canonical = {k: v for k, v in context.items() if k not in _VOLATILE_CONTEXT_KEYS}
+        return route, _context_digest(canonical)
 
     async def render_route(
         self,
@@ -38,15 +142,106 @@ class SSRRenderer:
         """
         try:
             loop = asyncio.get_running_loop()
-            # Run the synchronous `dev_server.render_route` in a thread pool executor
-            # The dev_server.render_route is now synchronous in its call to subprocess.run
-            html = await loop.run_in_executor(
-                None, self.bundler.dev_server.render_route, route, context
-            )
-            return html
+            if self._cache_ttl <= 0 and not self._coalesce_renders:
+                # Nothing would use the key; skip serializing and hashing the context
+                return await self._render_uncached(loop, route, context)
+
+            key = self._cache_key(route, context)
+            cached = self._cache_lookup(key)
+            if cached is not None:
+                return cached
+
+            if not self._coalesce_renders:
+                return await self._render_shared(loop, key, route, context)
+
+            # Coalesce identical renders already in flight on this loop. The
+            # render runs as its own task so a cancelled caller (e.g. a client
+            # disconnect) never aborts the render the other callers share.
+            task = self._inflight.get(key)
+            if task is None or task.get_loop() is not loop:
+                task = loop.create_task(self._render_shared(loop, key, route, context))
+                self._inflight[key] = task
+                task.add_done_callback(functools.partial(self._inflight_done, key))
+
+            return await asyncio.shield(task)
         except Exception as e:
             raise SSRError(f"Failed to render route '{route}': {e}") from e
 
+    async def _render_shared(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        key: Tuple[str, str],
+        route: str,
+        context: Optional[Dict[str, Any]]
+    ) -> str:
+        """Render once for every caller waiting on key and cache the result."""
+        html = await self._render_uncached(loop, route, context)
+        self._cache_store(key, html)
+        return html
+
+    def _inflight_done(self, key: Tuple[str, str], task: "asyncio.Task[str]") -> None:
+        """Forget a finished shared render."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # Mark retrieved even if every caller was cancelled
+
+    def _cache_lookup(self, key: Tuple[str, str]) -> Optional[str]:
+        """Return a fresh cached render for key, counting the hit or miss."""
+        if self._cache_ttl <= 0:
+            return None
+        cached = self._render_cache.get(key)
+        if cached is not None:
+            if time.monotonic() - cached[0] < self._cache_ttl:
+                self._render_cache.move_to_end(key)
+                self._cache_hits += 1
+                return cached[1]
+            self._render_cache.pop(key, None)
+        self._cache_misses += 1
+        return None
+
+    def _cache_store(self, key: Tuple[str, str], html: str) -> None:
+        """Cache a finished render, evicting the least recently used entry."""
+        if self._cache_ttl <= 0:
+            return
+        self._render_cache[key] = (time.monotonic(), html)
+        if len(self._render_cache) > self._cache_size:
+            self._render_cache.popitem(last=False)
+
+    async def _render_uncached(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        route: str,
+        context: Optional[Dict[str, Any]]
+    ) -> str:
+        """Render through the bundler, bounded by the per-loop render semaphore."""
+        semaphore = self._render_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._render_semaphores[loop] = asyncio.Semaphore(self._max_concurrent_renders)
+
+        # Run the synchronous `dev_server.render_route` in a thread pool executor,
+        # bounded so a burst of requests doesn't queue more renders than workers
+        async with semaphore:
+            return await loop.run_in_executor(
+                None, self.bundler.dev_server.render_route, route, context
+            )
+
+    def render_cache_clear(self) -> None:
+        """Drop all cached renders, e.g. after the bundler rebuilds."""
+        self._render_cache.clear()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Return render cache hit/miss counters and current size."""
+        total = self._cache_hits + self._cache_misses
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "hit_rate": self._cache_hits / total if total else 0.0,
+            "size": len(self._render_cache),
+            "max_size": self._cache_size,
+            "ttl": self._cache_ttl,
+        }
+
     def render_route_sync(
         self,
         route: str,
@@ -54,8 +249,60 @@ class SSRRenderer:
     ) -> str:
         """
         Synchronous version of render_route.
+
+        The bundler render is itself blocking, so this calls it directly on
+        the calling thread instead of driving an event loop. The render cache
+        is shared with render_route, but render_route's per-loop semaphore and
+        in-flight coalescing are skipped: concurrent sync renders are limited
+        only by the SSR worker pool, whose LifoQueue blocks callers until a
+        worker is free.
         """
-        return asyncio.run(self.render_route(route, context))
+        try:
+            if self._cache_ttl <= 0:
+                return self.bundler.dev_server.render_route(route, context)
+
+            key = self._cache_key(route, context)
+            cached = self._cache_lookup(key)
+            if cached is not None:
+                return cached
+
+            html = self.bundler.dev_server.render_route(route, context)
+            self._cache_store(key, html)
+            return html
+        except Exception as e:
+            raise SSRError(f"Failed to render route '{route}': {e}") from e
+
+    def render_routes_sync(
+        self,
+        routes: List[str],
+        context: Optional[Dict[str, Any]] = None
+    ) -> List[str]:
+        """
+        Render several routes concurrently on one loop, e.g. for pre-rendering.
+        """
+        async def render_all() -> List[str]:
+            return list(await asyncio.gather(
+                *(self.render_route(route, context) for route in routes)
+            ))
+        return _get_loop().run_until_complete(render_all())
+
+
+# Convenience functions share one renderer (and its bundler, SSR workers and
+# render cache) per project root instead of building a new one per call
+_shared_renderers: Dict[Path, SSRRenderer] = {}
+_shared_renderers_lock = threading.Lock()
+
+
+def _get_shared_renderer(project_root: Optional[Path] = None) -> SSRRenderer:
+    """Return the renderer for project_root, creating it on first use."""
+    root = Path(project_root).resolve() if project_root else Path.cwd().resolve()
+    renderer = _shared_renderers.get(root)
+    if renderer is None:
+        with _shared_renderers_lock:
+            renderer = _shared_renderers.get(root)
+            if renderer is None:
+                renderer = _shared_renderers[root] = SSRRenderer(root)
+    return renderer
 
 
 # Convenience functions for the router
@@ -67,8 +314,7 @@ async def render_route(
     """
     Convenience function to render a route with inline bundle.
     """
-    renderer = SSRRenderer(project_root)
-    return await renderer.render_route(route, context)
+    return await _get_shared_renderer(project_root).render_route(route, context)
 
 
 def render_route_sync(
@@ -77,8 +323,7 @@ def render_route_sync(
     project_root: Optional[Path] = None
 ) -> str:
     """Synchronous convenience function."""
-    renderer = SSRRenderer(project_root)
-    return renderer.render_route_sync(route, context)
+    return _get_shared_renderer(project_root).render_route_sync(route, context)
 
 
 if __name__ == "__main__":
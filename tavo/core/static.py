@@ -0,0 +1,95 @@
+"""
+Tavo Static Files
+
+Static file serving that can hand the file transfer off to a fronting
+reverse proxy (nginx X-Accel-Redirect / Apache X-Sendfile), so file bytes
+go out through the proxy's sendfile() path instead of through Python.
+"""
+
+import mimetypes
+import os
+from typing import Any, Optional
+from urllib.parse import quote
+
+from starlette.responses import Response
+from starlette.staticfiles import PathLike, StaticFiles
+from starlette.types import Scope
+
+# Header each supported proxy reads to serve the file itself
+_SENDFILE_HEADERS = {
+    "nginx": "X-Accel-Redirect",
+    "apache": "X-Sendfile",
+}
+
+
+class SendfileStaticFiles(StaticFiles):
+    """
+    StaticFiles that delegates file delivery to a reverse proxy when enabled.
+
+    With mode ``"nginx"`` a file response becomes an empty response carrying
+    ``X-Accel-Redirect: <internal_prefix>/<relative path>``; the prefix must be
+    an ``internal`` nginx location aliased to the same directory. With mode
+    ``"apache"`` it carries ``X-Sendfile: <absolute path>`` for mod_xsendfile.
+    Path resolution and traversal checks are Starlette's own ``lookup_path``;
+    without a mode (the default) responses are streamed exactly as StaticFiles does.
+    """
+
+    def __init__(
+        self,
+        *,
+        directory: PathLike,
+        sendfile_mode: Optional[str] = None,
+        internal_prefix: str = "/__internal_static",
+        **kwargs: Any
+    ):
+        """
+        Initialize static file serving.
+
+        Args:
+            directory: Directory to serve files from
+            sendfile_mode: "nginx" or "apache"; defaults to the TAVO_XSENDFILE
+                environment variable, unset meaning serve files directly
+            internal_prefix: Internal nginx location the files are aliased under
+            **kwargs: Passed through to StaticFiles
+        """
+        super().__init__(directory=directory, **kwargs)
+
+        mode = (sendfile_mode if sendfile_mode is not None else os.getenv("TAVO_XSENDFILE", "")).lower()
+        if mode and mode not in _SENDFILE_HEADERS:
+            raise ValueError(
+                f"Unsupported sendfile mode {mode!r}; expected one of {sorted(_SENDFILE_HEADERS)}"
+            )
+
+        self.sendfile_header = _SENDFILE_HEADERS.get(mode)
+        self.internal_prefix = internal_prefix.rstrip("/")
+        # Same normalization lookup_path applies to the directory
+        self._root = (
+            os.path.abspath(directory) if self.follow_symlink else os.path.realpath(directory)
+        )
+
+    def file_response(
+        self,
+        full_path: PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        if self.sendfile_header is None:
+            return super().file_response(full_path, stat_result, scope, status_code)
+
+        full_path = os.fspath(full_path)
+        if self.sendfile_header == "X-Sendfile":
+            location = full_path
+        else:
+            relative = os.path.relpath(full_path, self._root)
+            if relative.startswith(os.pardir):
+                # Found in a package directory the proxy doesn't know about
+                return super().file_response(full_path, stat_result, scope, status_code)
+            location = f"{self.internal_prefix}/{quote(relative.replace(os.sep, '/'))}"
+
+        media_type = mimetypes.guess_type(full_path)[0] or "application/octet-stream"
+        return Response(
+            status_code=status_code,
+            headers={self.sendfile_header: location},
+            media_type=media_type,
+        )
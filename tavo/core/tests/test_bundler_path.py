@@ -0,0 +1,105 @@
+"""
+Tests for get_bundler_path platform resolution
+"""
+
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from tavo.core.utils import bundler
+from tavo.core.utils.bundler import BundlerNotFound, get_bundler_path
+
+
+@pytest.fixture
+def target_dir(tmp_path, monkeypatch) -> Path:
+    """Point the bundler lookup at an empty target directory"""
+    monkeypatch.setattr(bundler, "_BUNDLER_ROOT", str(tmp_path))
+    get_bundler_path.cache_clear()
+    yield tmp_path
+    get_bundler_path.cache_clear()
+
+
+def use_platform(monkeypatch, system: str, machine: str) -> None:
+    monkeypatch.setattr(bundler, "_SYSTEM", system)
+    monkeypatch.setattr(bundler, "_MACHINE", machine)
+
+
+def build_binary(target_dir: Path, triple: str, name: str = "ssr-bundler", executable: bool = True) -> Path:
+    path = target_dir / triple / "release" / name
+    path.parent.mkdir(parents=True)
+    path.write_text("")
+    if executable:
+        path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return path
+
+
+@pytest.mark.skipif(os.name == "nt", reason="exec bits are POSIX-only")
+class TestGetBundlerPath:
+
+    @pytest.mark.parametrize("system, machine, triple, name", [
+        ("linux", "x86_64", "x86_64-unknown-linux-gnu", "ssr-bundler"),
+        ("linux", "aarch64", "aarch64-unknown-linux-gnu", "ssr-bundler"),
+        ("darwin", "aarch64", "aarch64-apple-darwin", "ssr-bundler"),
+        ("windows", "x86_64", "x86_64-pc-windows-msvc", "ssr-bundler.exe"),
+    ])
+    def test_native_binary(self, target_dir, monkeypatch, system, machine, triple, name):
+        """The binary built for the host platform is returned"""
+        use_platform(monkeypatch, system, machine)
+        path = build_binary(target_dir, triple, name)
+        assert get_bundler_path() == path
+
+    def test_prefers_native_over_x86_64(self, target_dir, monkeypatch):
+        """A native build wins over an x86_64 one"""
+        use_platform(monkeypatch, "darwin", "aarch64")
+        build_binary(target_dir, "x86_64-apple-darwin")
+        native = build_binary(target_dir, "aarch64-apple-darwin")
+        assert get_bundler_path() == native
+
+    def test_falls_back_to_x86_64(self, target_dir, monkeypatch):
+        """Without a native build the x86_64 build is used"""
+        use_platform(monkeypatch, "darwin", "aarch64")
+        fallback = build_binary(target_dir, "x86_64-apple-darwin")
+        assert get_bundler_path() == fallback
+
+    def test_unsupported_platform(self, target_dir, monkeypatch):
+        """Unknown systems raise BundlerNotFound"""
+        use_platform(monkeypatch, "plan9", "x86_64")
+        with pytest.raises(BundlerNotFound, match="Unsupported platform"):
+            get_bundler_path()
+
+    def test_missing_binary_reports_native_path(self, target_dir, monkeypatch):
+        """The error names the preferred (native) location"""
+        use_platform(monkeypatch, "linux", "aarch64")
+        with pytest.raises(BundlerNotFound, match="aarch64-unknown-linux-gnu"):
+            get_bundler_path()
+
+    def test_not_executable(self, target_dir, monkeypatch):
+        """A binary without the exec bit is rejected"""
+        use_platform(monkeypatch, "linux", "x86_64")
+        build_binary(target_dir, "x86_64-unknown-linux-gnu", executable=False)
+        with pytest.raises(BundlerNotFound, match="not executable"):
+            get_bundler_path()
+
+    def test_directory_rejected(self, target_dir, monkeypatch):
+        """A directory at the binary path is not accepted"""
+        use_platform(monkeypatch, "linux", "x86_64")
+        (target_dir / "x86_64-unknown-linux-gnu" / "release" / "ssr-bundler").mkdir(parents=True)
+        with pytest.raises(BundlerNotFound):
+            get_bundler_path()
+
+    def test_found_path_cached_missing_not(self, target_dir, monkeypatch):
+        """A miss is retried on the next call; a hit is cached until cache_clear"""
+        use_platform(monkeypatch, "linux", "x86_64")
+        with pytest.raises(BundlerNotFound):
+            get_bundler_path()
+
+        path = build_binary(target_dir, "x86_64-unknown-linux-gnu")
+        assert get_bundler_path() == path
+
+        path.unlink()
+        assert get_bundler_path() == path
+        get_bundler_path.cache_clear()
+        with pytest.raises(BundlerNotFound):
+            get_bundler_path()
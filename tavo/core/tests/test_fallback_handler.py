@@ -0,0 +1,123 @@
+"""
+Tests for install_fallback_handler and the routing it replaces
+"""
+
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import HTMLResponse, PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from tavo.core.routing import install_fallback_handler
+
+
+async def users(request: Request) -> PlainTextResponse:
+    return PlainTextResponse(f"users:{request.method}")
+
+
+async def ssr(request: Request) -> HTMLResponse:
+    return HTMLResponse(f"ssr:{request.url.path}")
+
+
+def allowed_methods(response) -> set:
+    """Methods named in a response's Allow header, ignoring order"""
+    header = response.headers.get("allow")
+    return set(header.split(", ")) if header else set()
+
+
+def make_app() -> Starlette:
+    """App with one user route and the SSR fallback installed"""
+    app = Starlette(routes=[Route("/api/users", users, methods=["GET", "POST"])])
+    install_fallback_handler(app.router, ssr)
+    return app
+
+
+def make_catch_all_app() -> Starlette:
+    """The catch-all route setup install_fallback_handler replaced"""
+    return Starlette(routes=[
+        Route("/api/users", users, methods=["GET", "POST"]),
+        Route("/{path:path}", ssr),
+    ])
+
+
+class TestFallbackHandler:
+
+    def setup_method(self):
+        """Create a client for each test"""
+        self.client = TestClient(make_app())
+
+    def test_get_unmatched_path(self):
+        """GET of an unmatched path is rendered by the handler"""
+        response = self.client.get("/about")
+        assert response.status_code == 200
+        assert response.text == "ssr:/about"
+
+    def test_get_root(self):
+        """The root path falls through to the handler"""
+        response = self.client.get("/")
+        assert response.status_code == 200
+        assert response.text == "ssr:/"
+
+    def test_head_unmatched_path(self):
+        """HEAD is served by the handler without a body"""
+        response = self.client.head("/about")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/html")
+        assert response.content == b""
+
+    @pytest.mark.parametrize("method", ["POST", "PUT", "PATCH", "DELETE"])
+    def test_other_methods_not_allowed(self, method):
+        """Non-GET/HEAD methods get 405 with an Allow header"""
+        response = self.client.request(method, "/about")
+        assert response.status_code == 405
+        assert response.headers["allow"] == "GET, HEAD"
+
+    def test_user_routes_take_precedence(self):
+        """Matched routes never reach the handler"""
+        assert self.client.get("/api/users").text == "users:GET"
+        assert self.client.post("/api/users").text == "users:POST"
+
+    def test_redirect_slashes_disabled(self):
+        """Installing the handler turns off slash redirects"""
+        assert make_app().router.redirect_slashes is False
+
+    def test_trailing_slash_goes_to_handler(self):
+        """A trailing slash is not redirected to the matching route"""
+        response = self.client.get("/api/users/", follow_redirects=False)
+        assert response.status_code == 200
+        assert response.text == "ssr:/api/users/"
+
+    def test_trailing_slash_other_method(self):
+        """A trailing-slash POST gets 405 rather than a redirect"""
+        response = self.client.post("/api/users/", follow_redirects=False)
+        assert response.status_code == 405
+        assert response.headers["allow"] == "GET, HEAD"
+
+    def test_websocket_not_found(self):
+        """Unmatched websocket scopes are closed, not sent to the handler"""
+        with pytest.raises(WebSocketDisconnect):
+            with self.client.websocket_connect("/about"):
+                pass
+
+
+@pytest.mark.parametrize("method, path", [
+    ("GET", "/about"),
+    ("GET", "/"),
+    ("HEAD", "/about"),
+    ("POST", "/about"),
+    ("DELETE", "/nested/page"),
+    ("GET", "/api/users"),
+    ("POST", "/api/users"),
+    ("GET", "/api/users/"),
+    ("POST", "/api/users/"),
+])
+def test_matches_catch_all_route(method, path):
+    """Responses are the same as with a trailing catch-all route"""
+    expected = TestClient(make_catch_all_app()).request(method, path, follow_redirects=False)
+    actual = TestClient(make_app()).request(method, path, follow_redirects=False)
+    assert actual.status_code == expected.status_code
+    assert actual.content == expected.content
+    # Route joins its methods set, so the catch-all's Allow order varies per hash seed
+    assert allowed_methods(actual) == allowed_methods(expected)
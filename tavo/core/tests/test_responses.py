@@ -0,0 +1,67 @@
+"""
+Tests for ORJSONResponse
+"""
+
+import json
+
+import pytest
+from starlette.responses import JSONResponse
+
+from tavo.core import responses
+from tavo.core.responses import ORJSONResponse
+
+
+CONTENT = [
+    {"a": 1, "b": [1, 2.5, None, True]},
+    {"text": "héllo ✓", "nested": {"k": "v"}},
+    [1, "two", {"three": 3}],
+    None,
+    "plain",
+]
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def orjson_available(request, monkeypatch):
+    """Run each test with and without orjson"""
+    if request.param and not responses.ORJSON_AVAILABLE:
+        pytest.skip("orjson is not installed")
+    monkeypatch.setattr(responses, "ORJSON_AVAILABLE", request.param)
+    return request.param
+
+
+class TestORJSONResponse:
+
+    @pytest.mark.parametrize("content", CONTENT)
+    def test_matches_json_response(self, orjson_available, content):
+        """Output is byte-identical to Starlette's JSONResponse"""
+        assert ORJSONResponse(content).body == JSONResponse(content).body
+
+    def test_headers(self, orjson_available):
+        """Content type, length and status are set like JSONResponse"""
+        response = ORJSONResponse({"ok": True}, status_code=201)
+        assert response.status_code == 201
+        assert response.media_type == "application/json"
+        assert response.headers["content-length"] == str(len(response.body))
+
+    def test_wide_int_falls_back_to_stdlib(self, orjson_available):
+        """Integers orjson can't encode still produce JSONResponse output"""
+        content = {"big": 2 ** 70, "small": -(2 ** 70)}
+        response = ORJSONResponse(content)
+        assert response.body == JSONResponse(content).body
+        assert json.loads(response.body) == content
+
+    def test_fallback_on_type_error(self, monkeypatch):
+        """Any TypeError from orjson falls back to JSONResponse"""
+        if not responses.ORJSON_AVAILABLE:
+            pytest.skip("orjson is not installed")
+
+        def failing_dumps(content, option=None):
+            raise TypeError("unsupported")
+
+        monkeypatch.setattr(responses.orjson, "dumps", failing_dumps)
+        assert ORJSONResponse({"a": 1}).body == JSONResponse({"a": 1}).body
+
+    def test_unencodable_content_still_raises(self, orjson_available):
+        """Content neither encoder supports raises TypeError"""
+        with pytest.raises(TypeError):
+            ORJSONResponse({"obj": object()})
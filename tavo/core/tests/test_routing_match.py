@@ -0,0 +1,171 @@
+"""
+Tests for FileBasedRouter route ordering and match_route
+"""
+
+import asyncio
+import itertools
+from pathlib import Path
+
+import pytest
+from starlette.routing import Match
+from starlette.testclient import TestClient
+
+from tavo.core.routing import FileBasedRouter, _route_for, _route_priority
+
+
+# Page directories under app/, as a user would lay them out
+PAGE_DIRS = [
+    "",
+    "about",
+    "users",
+    "users/me",
+    "users/[id]",
+    "users/[id]/posts",
+    "users/[id]/posts/[post_id]",
+    "users/me/posts/latest",
+    "users/[user]/posts/latest",
+    "blog/[slug]",
+    "blog/archive",
+    "docs/[section]/[page]",
+    "docs/api/[page]",
+    "docs/[section]/index",
+    "files/report-[name]",
+]
+
+PATHS = [
+    "/",
+    "/about",
+    "/users",
+    "/users/me",
+    "/users/42",
+    "/users/me/posts",
+    "/users/42/posts",
+    "/users/42/posts/7",
+    "/users/me/posts/latest",
+    "/users/42/posts/latest",
+    "/blog/archive",
+    "/blog/hello-world",
+    "/docs/api/auth",
+    "/docs/guide/intro",
+    "/docs/api/index",
+    "/docs/guide/index",
+    "/files/report-q3",
+    "/files/other",
+    "/missing",
+    "/users/42/unknown",
+]
+
+
+class FakeRenderer:
+    """Renders the matched route and its parameters instead of a page"""
+
+    async def render_route(self, route, context):
+        params = ",".join(f"{k}={v}" for k, v in sorted(context["route_params"].items()))
+        return f"{route}|{params}"
+
+
+def make_router(tmp_path: Path, page_dirs, **kwargs) -> FileBasedRouter:
+    """Discover SSR routes from page.tsx files in the given directories"""
+    app_dir = tmp_path / "app"
+    for page_dir in page_dirs:
+        directory = app_dir / page_dir
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / "page.tsx").write_text("export default function Page() { return null; }")
+
+    router = FileBasedRouter(app_dir, renderer=FakeRenderer(), **kwargs)
+    asyncio.run(router.discover_routes())
+    return router
+
+
+def starlette_dispatch(router: FileBasedRouter, path: str):
+    """(route path, params) that a Starlette Router over router.routes serves path with"""
+    client = TestClient(router.get_starlette_routes())
+    response = client.get(path)
+    if response.status_code == 404:
+        return None
+    route, params = response.text.split("|")
+    return route, dict(item.split("=") for item in params.split(",") if item)
+
+
+def matched(router: FileBasedRouter, path: str):
+    match = router.match_route(path)
+    return None if match is None else (match.path, match.params)
+
+
+class TestMatchPriority:
+
+    def test_static_segment_beats_parameter(self, tmp_path):
+        """/users/me is preferred over /users/{id}"""
+        router = make_router(tmp_path, ["users/me", "users/[id]"])
+        assert matched(router, "/users/me") == ("/users/me", {})
+        assert matched(router, "/users/42") == ("/users/{id}", {"id": "42"})
+
+    @pytest.mark.parametrize("routes", list(itertools.permutations(["/users/{id}", "/users/me", "/users"])))
+    def test_priority_independent_of_discovery_order(self, routes):
+        """Sorting by priority puts static routes first whatever the discovery order"""
+        ordered = sorted((_route_for(path, lambda request: None) for path in routes), key=_route_priority)
+        assert [route.path for route in ordered].index("/users/me") < [route.path for route in ordered].index("/users/{id}")
+
+    def test_static_later_segment_beats_parameter(self, tmp_path):
+        """A static segment wins even below a parameter"""
+        router = make_router(tmp_path, ["users/[id]/posts/latest", "users/[id]/posts/[post_id]"])
+        assert matched(router, "/users/1/posts/latest") == ("/users/{id}/posts/latest", {"id": "1"})
+        assert matched(router, "/users/1/posts/9") == ("/users/{id}/posts/{post_id}", {"id": "1", "post_id": "9"})
+
+    def test_backtracks_to_parameter(self, tmp_path):
+        """A static branch that dead-ends falls back to the parameter branch"""
+        router = make_router(tmp_path, ["docs/api/[page]", "docs/[section]/index"])
+        assert matched(router, "/docs/api/index") == ("/docs/api/{page}", {"page": "index"})
+        assert matched(router, "/docs/guide/index") == ("/docs/{section}/index", {"section": "guide"})
+
+    def test_parameter_names_per_route(self, tmp_path):
+        """Routes sharing a parameter position keep their own parameter names"""
+        router = make_router(tmp_path, ["users/[id]/posts", "users/[user]/posts/latest"])
+        assert matched(router, "/users/5/posts") == ("/users/{id}/posts", {"id": "5"})
+        assert matched(router, "/users/5/posts/latest") == ("/users/{user}/posts/latest", {"user": "5"})
+
+    def test_empty_segment_does_not_bind(self, tmp_path):
+        """A parameter never matches an empty segment"""
+        router = make_router(tmp_path, ["users/[id]"])
+        assert router.match_route("/users/") is None
+
+    def test_partial_segment_parameter(self, tmp_path):
+        """Routes the trie can't index are still matched through Starlette"""
+        router = make_router(tmp_path, ["files/report-[name]"])
+        assert matched(router, "/files/report-q3") == ("/files/report-{name}", {"name": "q3"})
+        assert router.match_route("/files/other") is None
+
+
+class TestStarletteParity:
+
+    @pytest.fixture(params=[False, True], ids=["forward", "reversed"])
+    def router(self, request, tmp_path):
+        page_dirs = list(reversed(PAGE_DIRS)) if request.param else PAGE_DIRS
+        return make_router(tmp_path, page_dirs)
+
+    @pytest.mark.parametrize("path", PATHS)
+    def test_match_route_agrees_with_dispatch(self, router, path):
+        """match_route picks the route Starlette dispatches to, with the same params"""
+        assert matched(router, path) == starlette_dispatch(router, path)
+
+    @pytest.mark.parametrize("path", PATHS)
+    def test_trie_agrees_with_linear_scan(self, router, path):
+        """The trie and the legacy linear scan agree"""
+        linear = FileBasedRouter._match_route_linear(path, router.routes)
+        expected = None if linear is None else (linear.path, linear.params)
+        assert matched(router, path) == expected
+
+    def test_routes_sorted_by_priority(self, router):
+        """Discovered routes are ordered most specific first"""
+        assert router.routes == sorted(router.routes, key=_route_priority)
+        paths = [route.path for route in router.routes]
+        assert paths.index("/users/me") < paths.index("/users/{id}")
+        assert paths[-1] == "/files/report-{name}"
+
+    def test_every_path_matches_first_full_route(self, router):
+        """The first FULL match in router.routes is what match_route returns"""
+        for path in PATHS:
+            scope = {"type": "http", "path": path, "method": "GET"}
+            first = next((route for route in router.routes if route.matches(scope)[0] == Match.FULL), None)
+            match = router.match_route(path)
+            assert (first and first.path) == (match and match.path)
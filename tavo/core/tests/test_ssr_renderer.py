@@ -0,0 +1,170 @@
+"""
+Tests for SSRRenderer caching and in-flight render coalescing
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from tavo.core import ssr
+from tavo.core.ssr import SSRError, SSRRenderer
+
+
+class FakeDevServer:
+    """Blocking stand-in for the bundler dev server that counts renders"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def render_route(self, route, context):
+        with self._lock:
+            self.calls.append(route)
+        time.sleep(self.delay)
+        if route == "/fail":
+            raise RuntimeError("boom")
+        return f"<html>{route}</html>"
+
+
+class FakeBundler:
+    def __init__(self, dev_server):
+        self.dev_server = dev_server
+
+
+@pytest.fixture
+def dev_server(monkeypatch):
+    server = FakeDevServer()
+    monkeypatch.setattr(ssr, "get_bundler", lambda project_root: FakeBundler(server))
+    return server
+
+
+def make_renderer(tmp_path, **kwargs) -> SSRRenderer:
+    return SSRRenderer(project_root=tmp_path, **kwargs)
+
+
+class TestRenderCache:
+
+    def test_cache_off_by_default(self, tmp_path, dev_server, monkeypatch):
+        """Without a TTL or coalescing every request renders and no key is built"""
+        renderer = make_renderer(tmp_path)
+        monkeypatch.setattr(SSRRenderer, "_cache_key", pytest.fail)
+
+        for _ in range(2):
+            assert asyncio.run(renderer.render_route("/a", {"url": "/a"})) == "<html>/a</html>"
+            assert renderer.render_route_sync("/a", {"url": "/a"}) == "<html>/a</html>"
+
+        assert dev_server.calls == ["/a"] * 4
+        assert renderer.get_cache_stats()["size"] == 0
+
+    def test_ttl_cache_hits(self, tmp_path, dev_server):
+        """Identical route and context are served from the cache"""
+        renderer = make_renderer(tmp_path, cache_ttl=60)
+
+        asyncio.run(renderer.render_route("/a", {"q": 1}))
+        asyncio.run(renderer.render_route("/a", {"q": 1}))
+        renderer.render_route_sync("/a", {"q": 1})
+        asyncio.run(renderer.render_route("/a", {"q": 2}))
+
+        assert dev_server.calls == ["/a", "/a"]
+        stats = renderer.get_cache_stats()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (2, 2, 2)
+
+    def test_volatile_keys_ignored(self, tmp_path, dev_server):
+        """Per-request fields such as request_id don't split the cache"""
+        renderer = make_renderer(tmp_path, cache_ttl=60)
+
+        asyncio.run(renderer.render_route("/a", {"q": 1, "request_id": "x"}))
+        asyncio.run(renderer.render_route("/a", {"q": 1, "request_id": "y"}))
+
+        assert dev_server.calls == ["/a"]
+
+    def test_cache_clear(self, tmp_path, dev_server):
+        """render_cache_clear forces the next request to render"""
+        renderer = make_renderer(tmp_path, cache_ttl=60)
+
+        asyncio.run(renderer.render_route("/a"))
+        renderer.render_cache_clear()
+        asyncio.run(renderer.render_route("/a"))
+
+        assert dev_server.calls == ["/a", "/a"]
+
+    def test_expired_entry_renders_again(self, tmp_path, dev_server, monkeypatch):
+        """Entries older than the TTL are not reused"""
+        renderer = make_renderer(tmp_path, cache_ttl=5)
+        now = [100.0]
+        monkeypatch.setattr(ssr.time, "monotonic", lambda: now[0])
+
+        asyncio.run(renderer.render_route("/a"))
+        now[0] += 10
+        asyncio.run(renderer.render_route("/a"))
+
+        assert dev_server.calls == ["/a", "/a"]
+
+    def test_errors_wrapped(self, tmp_path, dev_server):
+        """Render failures surface as SSRError"""
+        renderer = make_renderer(tmp_path, cache_ttl=60, coalesce_renders=True)
+        with pytest.raises(SSRError, match="boom"):
+            asyncio.run(renderer.render_route("/fail"))
+        assert renderer.get_cache_stats()["size"] == 0
+
+
+class TestCoalescing:
+
+    def test_concurrent_renders_share_one(self, tmp_path, dev_server):
+        """Concurrent identical requests render once"""
+        dev_server.delay = 0.05
+        renderer = make_renderer(tmp_path, coalesce_renders=True)
+
+        async def main():
+            return await asyncio.gather(*(renderer.render_route("/b") for _ in range(5)))
+
+        assert asyncio.run(main()) == ["<html>/b</html>"] * 5
+        assert dev_server.calls == ["/b"]
+        assert renderer._inflight == {}
+
+    def test_not_coalesced_when_disabled(self, tmp_path, dev_server):
+        """Without coalescing each concurrent request renders"""
+        dev_server.delay = 0.02
+        renderer = make_renderer(tmp_path)
+
+        async def main():
+            return await asyncio.gather(*(renderer.render_route("/b") for _ in range(3)))
+
+        asyncio.run(main())
+        assert dev_server.calls == ["/b"] * 3
+
+    def test_cancelled_leader_does_not_abort_followers(self, tmp_path, dev_server):
+        """Cancelling the first caller leaves the shared render running"""
+        dev_server.delay = 0.2
+        renderer = make_renderer(tmp_path, coalesce_renders=True)
+
+        async def main():
+            leader = asyncio.ensure_future(renderer.render_route("/b"))
+            follower = asyncio.ensure_future(renderer.render_route("/b"))
+            await asyncio.sleep(0.05)
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return await follower
+
+        assert asyncio.run(main()) == "<html>/b</html>"
+        assert dev_server.calls == ["/b"]
+        assert renderer._inflight == {}
+
+    def test_shared_failure_reaches_every_caller(self, tmp_path, dev_server):
+        """A failed shared render fails every waiting caller"""
+        dev_server.delay = 0.05
+        renderer = make_renderer(tmp_path, coalesce_renders=True)
+
+        async def main():
+            return await asyncio.gather(
+                *(renderer.render_route("/fail") for _ in range(3)),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(main())
+        assert all(isinstance(result, SSRError) for result in results)
+        assert dev_server.calls == ["/fail"]
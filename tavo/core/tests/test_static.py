@@ -0,0 +1,110 @@
+"""
+Tests for SendfileStaticFiles
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from tavo.core.static import SendfileStaticFiles
+
+
+@pytest.fixture
+def public_dir(tmp_path) -> Path:
+    directory = tmp_path / "public"
+    (directory / "css").mkdir(parents=True)
+    (directory / "app.js").write_text("console.log('hi');")
+    (directory / "css" / "site theme.css").write_text("body {}")
+    (tmp_path / "secret.txt").write_text("secret")
+    return directory
+
+
+def make_client(public_dir: Path, **kwargs) -> TestClient:
+    app = Starlette(routes=[
+        Mount("/static", SendfileStaticFiles(directory=public_dir, **kwargs), name="static"),
+    ])
+    return TestClient(app)
+
+
+class TestSendfileModes:
+
+    def test_default_streams_files(self, public_dir, monkeypatch):
+        """Without a mode files are served like StaticFiles"""
+        monkeypatch.delenv("TAVO_XSENDFILE", raising=False)
+        response = make_client(public_dir).get("/static/app.js")
+        assert response.status_code == 200
+        assert response.text == "console.log('hi');"
+        assert "x-accel-redirect" not in response.headers
+        assert "x-sendfile" not in response.headers
+
+    def test_nginx_header(self, public_dir):
+        """nginx mode sends an empty body with an internal X-Accel-Redirect"""
+        response = make_client(public_dir, sendfile_mode="nginx").get("/static/app.js")
+        assert response.status_code == 200
+        assert response.headers["x-accel-redirect"] == "/__internal_static/app.js"
+        assert response.headers["content-type"].startswith(("text/javascript", "application/javascript"))
+        assert response.content == b""
+
+    def test_nginx_quotes_nested_path(self, public_dir):
+        """Nested paths use forward slashes and are URL-quoted"""
+        client = make_client(public_dir, sendfile_mode="nginx", internal_prefix="/protected/")
+        response = client.get("/static/css/site%20theme.css")
+        assert response.headers["x-accel-redirect"] == "/protected/css/site%20theme.css"
+        assert response.headers["content-type"].startswith("text/css")
+
+    def test_apache_header(self, public_dir):
+        """apache mode sends the absolute file path in X-Sendfile"""
+        response = make_client(public_dir, sendfile_mode="apache").get("/static/css/site%20theme.css")
+        assert response.status_code == 200
+        assert response.headers["x-sendfile"] == os.path.join(
+            os.path.realpath(public_dir), "css", "site theme.css"
+        )
+        assert response.content == b""
+
+    @pytest.mark.parametrize("mode, header", [("nginx", "x-accel-redirect"), ("APACHE", "x-sendfile")])
+    def test_mode_from_environment(self, public_dir, monkeypatch, mode, header):
+        """TAVO_XSENDFILE selects the mode, case-insensitively"""
+        monkeypatch.setenv("TAVO_XSENDFILE", mode)
+        response = make_client(public_dir).get("/static/app.js")
+        assert header in response.headers
+
+    def test_explicit_mode_overrides_environment(self, public_dir, monkeypatch):
+        """An explicit empty mode turns sendfile off even if the env var is set"""
+        monkeypatch.setenv("TAVO_XSENDFILE", "nginx")
+        response = make_client(public_dir, sendfile_mode="").get("/static/app.js")
+        assert "x-accel-redirect" not in response.headers
+        assert response.text == "console.log('hi');"
+
+    def test_unknown_mode_rejected(self, public_dir):
+        """Unsupported modes fail at construction"""
+        with pytest.raises(ValueError, match="Unsupported sendfile mode"):
+            SendfileStaticFiles(directory=public_dir, sendfile_mode="lighttpd")
+
+
+class TestSendfileLookup:
+
+    @pytest.mark.parametrize("mode", ["nginx", "apache"])
+    def test_missing_file(self, public_dir, mode):
+        """Missing files are 404 without a sendfile header"""
+        response = make_client(public_dir, sendfile_mode=mode).get("/static/missing.js")
+        assert response.status_code == 404
+        assert "x-accel-redirect" not in response.headers
+        assert "x-sendfile" not in response.headers
+
+    @pytest.mark.parametrize("mode", ["nginx", "apache"])
+    def test_traversal_blocked(self, public_dir, mode):
+        """Paths outside the directory are never handed to the proxy"""
+        response = make_client(public_dir, sendfile_mode=mode).get("/static/..%2Fsecret.txt")
+        assert response.status_code == 404
+        assert "x-accel-redirect" not in response.headers
+        assert "x-sendfile" not in response.headers
+
+    def test_head_request(self, public_dir):
+        """HEAD gets the same sendfile header"""
+        response = make_client(public_dir, sendfile_mode="nginx").head("/static/app.js")
+        assert response.status_code == 200
+        assert response.headers["x-accel-redirect"] == "/__internal_static/app.js"
@@ -1,35 +1,68 @@
+import functools
+import os
 import platform
+import stat
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+# Host OS and architecture never change within a process
+_SYSTEM = platform.system().lower()
+_MACHINE_ALIASES = {"amd64": "x86_64", "x64": "x86_64", "arm64": "aarch64"}
+_MACHINE = _MACHINE_ALIASES.get(platform.machine().lower(), platform.machine().lower())
+
+# up from tavo/core/utils → project root; kept as a str so lookups skip pathlib
+_BUNDLER_ROOT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "rust_bundler",
+    "target",
+)
+
+# (system, machine) -> (binary name, target triple)
+_PLATFORM_TABLE: Dict[Tuple[str, str], Tuple[str, str]] = {
+    ("windows", "x86_64"): ("ssr-bundler.exe", "x86_64-pc-windows-msvc"),
+    ("windows", "aarch64"): ("ssr-bundler.exe", "aarch64-pc-windows-msvc"),
+    ("darwin", "x86_64"): ("ssr-bundler", "x86_64-apple-darwin"),
+    ("darwin", "aarch64"): ("ssr-bundler", "aarch64-apple-darwin"),
+    ("linux", "x86_64"): ("ssr-bundler", "x86_64-unknown-linux-gnu"),
+    ("linux", "aarch64"): ("ssr-bundler", "aarch64-unknown-linux-gnu"),
+}
 
 class BundlerNotFound(Exception):
     pass
 
+@functools.lru_cache(maxsize=None)
 def get_bundler_path() -> Path:
-    """Return the path to the Rust bundler binary for the current platform."""
-    system = platform.system().lower()
-    if system == "windows":
-        bin_name = "ssr-bundler.exe"
-        target = "x86_64-pc-windows-msvc"
-    elif system == "darwin":
-        bin_name = "ssr-bundler"
-        target = "x86_64-apple-darwin"
-    elif system == "linux":
-        bin_name = "ssr-bundler"
-        target = "x86_64-unknown-linux-gnu"
-    else:
-        raise BundlerNotFound(f"Unsupported platform: {system}")
-
-    bin_path = (
-        Path(__file__).parent.parent.parent  # up from tavo/core/utils → project root
-        / "rust_bundler"
-        / "target"
-        / target
-        / "release"
-        / bin_name
-    )
-
-    if not bin_path.exists():
-        raise BundlerNotFound(f"Rust bundler not found at {bin_path}")
-
-    return bin_path
+    """
+    Return the path to the Rust bundler binary for the current platform.
+
+    The result is cached once found; call get_bundler_path.cache_clear()
+    after (re)building the bundler. A missing binary is not cached.
+    """
+    # Prefer a native build; an x86_64 one still runs under Rosetta/emulation
+    candidates = [
+        entry for entry in (
+            _PLATFORM_TABLE.get((_SYSTEM, _MACHINE)),
+            _PLATFORM_TABLE.get((_SYSTEM, "x86_64")),
+        ) if entry is not None
+    ]
+    if not candidates:
+        raise BundlerNotFound(f"Unsupported platform: {_SYSTEM}")
+
+    error: Optional[BundlerNotFound] = None
+    for bin_name, target in dict.fromkeys(candidates):
+        bin_path = os.path.join(_BUNDLER_ROOT, target, "release", bin_name)
+
+        try:
+            st = os.stat(bin_path)
+        except OSError:
+            error = error or BundlerNotFound(f"Rust bundler not found at {bin_path}")
+            continue
+
+        # exists() would also accept a directory or a binary without the exec bit
+        if not stat.S_ISREG(st.st_mode) or not os.access(bin_path, os.X_OK):
+            error = error or BundlerNotFound(f"Rust bundler at {bin_path} is not executable")
+            continue
+
+        return Path(bin_path)
+
+    raise error